@@ -5,11 +5,11 @@ from __future__ import annotations
 
 import sys
 
-from labtools.cli import main
-
 
 def run() -> int:
     """Invoke the labtools CLI."""
+    from labtools.cli import main
+
     result = main(standalone_mode=False)
     return int(result) if isinstance(result, int) else 0
 
@@ -5,8 +5,9 @@ Provides helpers for bootstrapping reusable lab environments based on
 shared infrastructure, automation, and documentation tooling.
 """
 
-__all__ = ["__version__"]
+__all__ = ["__version__", "__version_info__"]
 
-__version__ = "0.1.0"
+__version_info__: tuple[int, int, int] = (0, 1, 0)
+__version__ = ".".join(map(str, __version_info__))
 
 
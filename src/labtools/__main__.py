@@ -0,0 +1,6 @@
+"""Allow `python -m labtools` alongside the `labtools` console script."""
+
+from labtools.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -3,29 +3,211 @@
 from __future__ import annotations
 
 import pathlib
-from typing import Optional
+from functools import partial
+from importlib import import_module
+from typing import Callable, NamedTuple, Optional
 
 import click
 
-from .core import sync_core
-from .data import sync_data_modules
-from .docs import sync_docs
-from .infra import sync_modules
-from .mcp import sync_mcp_tools
-from .reports import sync_reports
-from .requirements import sync_requirements
-from .runtime import sync_runtime_modules
-from .shell import sync_helpers
-from .scaffold import create_project
+# Shared, stateless Click converters; decorating 9 near-identical commands
+# should not construct a fresh click.Path each time.
+_SRC_DIR = click.Path(file_okay=False, exists=True, path_type=pathlib.Path)
+_DST_DIR = click.Path(file_okay=False, path_type=pathlib.Path)
+_CFG_FILE = click.Path(dir_okay=False, exists=False, path_type=pathlib.Path)
+
+# Subsystem imports are deferred into each command callback so that a single
+# invocation (or `--help`) only pays for the subsystem it actually touches.
+# The sync groups themselves are built lazily via LazyGroup from the spec
+# table below: their Click decorators only run when the group is looked up.
+
+
+class LazyGroup(click.Group):
+    """Click group that builds subcommands on first lookup.
+
+    ``lazy_subcommands`` maps a subcommand name to a zero-argument builder
+    returning the command. The builder runs at most once; dispatching a
+    single subcommand therefore never constructs its siblings.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._lazy_subcommands: dict[str, Callable[[], click.Command]] = dict(
+            lazy_subcommands or {}
+        )
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self._lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, name)
+        if command is None:
+            builder = self._lazy_subcommands.get(name)
+            if builder is not None:
+                command = builder()
+                self.add_command(command, name)
+        return command
+
+
+class _SyncSpec(NamedTuple):
+    """Everything that differs between the near-identical `X sync` commands."""
+
+    name: str
+    group_help: str
+    command_help: str
+    option: str
+    dest: str
+    option_help: str
+    module: str
+    func: str
+    noun: str
+    incremental: bool = False
+
+
+_SYNC_SPECS: tuple[_SyncSpec, ...] = (
+    _SyncSpec(
+        name="infra",
+        group_help="Infrastructure module utilities.",
+        command_help="Copy Terraform/IaC modules from a filtered source export into labtools templates.",
+        option="--module",
+        dest="modules",
+        option_help="Relative module path under the source (e.g., modules/networking).",
+        module=".infra",
+        func="sync_modules",
+        noun="module(s)",
+    ),
+    _SyncSpec(
+        name="shell",
+        group_help="Shell helper utilities.",
+        command_help="Copy shell helper scripts from a filtered source export.",
+        option="--helper",
+        dest="helpers",
+        option_help="Relative helper file under the source (e.g., lib/logging.sh).",
+        module=".shell",
+        func="sync_helpers",
+        noun="helper file(s)",
+    ),
+    _SyncSpec(
+        name="docs",
+        group_help="Documentation template utilities.",
+        command_help="Copy documentation templates from a filtered source export.",
+        option="--document",
+        dest="documents",
+        option_help="Relative document path under the source (e.g., doc/templates/status-report.md).",
+        module=".docs",
+        func="sync_docs",
+        noun="document template(s)",
+    ),
+    _SyncSpec(
+        name="core",
+        group_help="Core Python module utilities.",
+        command_help="Copy core Python modules from a filtered source export.",
+        option="--module",
+        dest="modules",
+        option_help="Module/package under src/core to copy (e.g., utils).",
+        module=".core",
+        func="sync_core",
+        noun="core module(s)",
+        incremental=True,
+    ),
+    _SyncSpec(
+        name="data",
+        group_help="Data utility synchronization.",
+        command_help="Copy data loaders, cleaners, and related utilities.",
+        option="--module",
+        dest="modules",
+        option_help="Module under src/data to copy (e.g., loaders).",
+        module=".data",
+        func="sync_data_modules",
+        noun="data module(s)",
+    ),
+    _SyncSpec(
+        name="reports",
+        group_help="Reporting utility synchronization.",
+        command_help="Copy report generator components.",
+        option="--module",
+        dest="modules",
+        option_help="Module under src/reports to copy (e.g., generator).",
+        module=".reports",
+        func="sync_reports",
+        noun="report module(s)",
+    ),
+    _SyncSpec(
+        name="mcp",
+        group_help="MCP tool synchronization.",
+        command_help="Copy MCP tools from a filtered source export.",
+        option="--module",
+        dest="modules",
+        option_help="Module under src/mcp to copy (e.g., orchestrator).",
+        module=".mcp",
+        func="sync_mcp_tools",
+        noun="MCP module(s)",
+    ),
+    _SyncSpec(
+        name="runtime",
+        group_help="Runtime orchestration synchronization.",
+        command_help="Copy runtime orchestration primitives from a filtered source export.",
+        option="--module",
+        dest="modules",
+        option_help="Module under src/runtime to copy (e.g., jobs.py).",
+        module=".runtime",
+        func="sync_runtime_modules",
+        noun="runtime module(s)",
+    ),
+    _SyncSpec(
+        name="requirements",
+        group_help="Requirements file synchronization.",
+        command_help="Copy requirements files from a filtered source export.",
+        option="--file",
+        dest="files",
+        option_help="Requirements file name to copy (e.g., requirements.txt).",
+        module=".requirements",
+        func="sync_requirements",
+        noun="requirements file(s)",
+    ),
+)
+
+
+def _make_sync_group(spec: _SyncSpec) -> click.Group:
+    """Build the `<name> sync` group for one spec table row."""
+
+    def handler(source: pathlib.Path, destination: pathlib.Path, **kwargs) -> None:
+        func = getattr(import_module(spec.module, __package__), spec.func)
+        func(source_root=source, destination_root=destination, **kwargs)
+        count = len(kwargs[spec.dest])
+        click.echo(f"Copied {count} {spec.noun} from {source} to {destination}")
+
+    # Applied innermost-first, mirroring the usual decorator stack order.
+    if spec.incremental:
+        handler = click.option(
+            "--incremental",
+            is_flag=True,
+            default=False,
+            help="Keep existing destination trees and copy only changed files.",
+        )(handler)
+    command = click.option(
+        spec.option, spec.dest, multiple=True, required=True, help=spec.option_help
+    )(handler)
+    command = click.argument("destination", type=_DST_DIR)(command)
+    command = click.argument("source", type=_SRC_DIR)(command)
+    command = click.command("sync", help=spec.command_help)(command)
 
+    group = click.Group(name=spec.name, help=spec.group_help)
+    group.add_command(command)
+    return group
 
-@click.group()
+
+_LAZY_GROUPS: dict[str, Callable[[], click.Command]] = {
+    spec.name: partial(_make_sync_group, spec) for spec in _SYNC_SPECS
+}
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=_LAZY_GROUPS)
 def main() -> None:
     """Reusable tooling for building new lab environments."""
 
 
 @main.command("init")
-@click.argument("destination", type=click.Path(file_okay=False, path_type=pathlib.Path))
+@click.argument("destination", type=_DST_DIR)
 @click.option(
     "--template",
     default="default",
@@ -33,7 +215,7 @@ def main() -> None:
 )
 @click.option(
     "--config",
-    type=click.Path(dir_okay=False, exists=False, path_type=pathlib.Path),
+    type=_CFG_FILE,
     help="Optional YAML configuration file to customize the template.",
 )
 @click.option(
@@ -51,7 +233,7 @@ def init_command(
 
     create_project(destination=destination, template_name=template, config_path=config)
     click.echo(f"Lab project created at {destination}")
-    
+
     if with_all_tools:
         click.echo("Installing all available tools...")
         install_all_tools(destination)
@@ -61,202 +243,3 @@ def init_command(
         click.echo("  2. source activate.sh dev  # or: lab, test, stage, client")
         click.echo("  3. pip install -e .  # if you add a pyproject.toml")
         click.echo("  4. Review and customize the installed tools as needed")
-
-
-@main.group()
-def infra() -> None:
-    """Infrastructure module utilities."""
-
-
-@infra.command("sync")
-@click.argument("source", type=click.Path(file_okay=False, exists=True, path_type=pathlib.Path))
-@click.argument("destination", type=click.Path(file_okay=False, path_type=pathlib.Path))
-@click.option(
-    "--module",
-    "modules",
-    multiple=True,
-    required=True,
-    help="Relative module path under the source (e.g., modules/networking).",
-)
-def infra_sync(source: pathlib.Path, destination: pathlib.Path, modules: tuple[str, ...]) -> None:
-    """Copy Terraform/IaC modules from a filtered source export into labtools templates."""
-
-    sync_modules(source_root=source, destination_root=destination, modules=modules)
-    click.echo(f"Copied {len(modules)} module(s) from {source} to {destination}")
-
-
-@main.group()
-def shell() -> None:
-    """Shell helper utilities."""
-
-
-@shell.command("sync")
-@click.argument("source", type=click.Path(file_okay=False, exists=True, path_type=pathlib.Path))
-@click.argument("destination", type=click.Path(file_okay=False, path_type=pathlib.Path))
-@click.option(
-    "--helper",
-    "helpers",
-    multiple=True,
-    required=True,
-    help="Relative helper file under the source (e.g., lib/logging.sh).",
-)
-def shell_sync(source: pathlib.Path, destination: pathlib.Path, helpers: tuple[str, ...]) -> None:
-    """Copy shell helper scripts from a filtered source export."""
-
-    sync_helpers(source_root=source, destination_root=destination, helpers=helpers)
-    click.echo(f"Copied {len(helpers)} helper file(s) from {source} to {destination}")
-
-
-@main.group()
-def docs() -> None:
-    """Documentation template utilities."""
-
-
-@docs.command("sync")
-@click.argument("source", type=click.Path(file_okay=False, exists=True, path_type=pathlib.Path))
-@click.argument("destination", type=click.Path(file_okay=False, path_type=pathlib.Path))
-@click.option(
-    "--document",
-    "documents",
-    multiple=True,
-    required=True,
-    help="Relative document path under the source (e.g., doc/templates/status-report.md).",
-)
-def docs_sync(source: pathlib.Path, destination: pathlib.Path, documents: tuple[str, ...]) -> None:
-    """Copy documentation templates from a filtered source export."""
-
-    sync_docs(source_root=source, destination_root=destination, documents=documents)
-    click.echo(f"Copied {len(documents)} document template(s) from {source} to {destination}")
-
-
-@main.group()
-def core() -> None:
-    """Core Python module utilities."""
-
-
-@core.command("sync")
-@click.argument("source", type=click.Path(file_okay=False, exists=True, path_type=pathlib.Path))
-@click.argument("destination", type=click.Path(file_okay=False, path_type=pathlib.Path))
-@click.option(
-    "--module",
-    "modules",
-    multiple=True,
-    required=True,
-    help="Module/package under src/core to copy (e.g., utils).",
-)
-def core_sync(source: pathlib.Path, destination: pathlib.Path, modules: tuple[str, ...]) -> None:
-    """Copy core Python modules from a filtered source export."""
-
-    sync_core(source_root=source, destination_root=destination, modules=modules)
-    click.echo(f"Copied {len(modules)} core module(s) from {source} to {destination}")
-
-
-@main.group()
-def data() -> None:
-    """Data utility synchronization."""
-
-
-@data.command("sync")
-@click.argument("source", type=click.Path(file_okay=False, exists=True, path_type=pathlib.Path))
-@click.argument("destination", type=click.Path(file_okay=False, path_type=pathlib.Path))
-@click.option(
-    "--module",
-    "modules",
-    multiple=True,
-    required=True,
-    help="Module under src/data to copy (e.g., loaders).",
-)
-def data_sync(source: pathlib.Path, destination: pathlib.Path, modules: tuple[str, ...]) -> None:
-    """Copy data loaders, cleaners, and related utilities."""
-
-    sync_data_modules(source_root=source, destination_root=destination, modules=modules)
-    click.echo(f"Copied {len(modules)} data module(s) from {source} to {destination}")
-
-
-@main.group()
-def reports() -> None:
-    """Reporting utility synchronization."""
-
-
-@reports.command("sync")
-@click.argument("source", type=click.Path(file_okay=False, exists=True, path_type=pathlib.Path))
-@click.argument("destination", type=click.Path(file_okay=False, path_type=pathlib.Path))
-@click.option(
-    "--module",
-    "modules",
-    multiple=True,
-    required=True,
-    help="Module under src/reports to copy (e.g., generator).",
-)
-def reports_sync(source: pathlib.Path, destination: pathlib.Path, modules: tuple[str, ...]) -> None:
-    """Copy report generator components."""
-
-    sync_reports(source_root=source, destination_root=destination, modules=modules)
-    click.echo(f"Copied {len(modules)} report module(s) from {source} to {destination}")
-
-
-@main.group()
-def mcp() -> None:
-    """MCP tool synchronization."""
-
-
-@mcp.command("sync")
-@click.argument("source", type=click.Path(file_okay=False, exists=True, path_type=pathlib.Path))
-@click.argument("destination", type=click.Path(file_okay=False, path_type=pathlib.Path))
-@click.option(
-    "--module",
-    "modules",
-    multiple=True,
-    required=True,
-    help="Module under src/mcp to copy (e.g., orchestrator).",
-)
-def mcp_sync(source: pathlib.Path, destination: pathlib.Path, modules: tuple[str, ...]) -> None:
-    """Copy MCP tools from a filtered source export."""
-
-    sync_mcp_tools(source_root=source, destination_root=destination, modules=modules)
-    click.echo(f"Copied {len(modules)} MCP module(s) from {source} to {destination}")
-
-
-@main.group()
-def runtime() -> None:
-    """Runtime orchestration synchronization."""
-
-
-@runtime.command("sync")
-@click.argument("source", type=click.Path(file_okay=False, exists=True, path_type=pathlib.Path))
-@click.argument("destination", type=click.Path(file_okay=False, path_type=pathlib.Path))
-@click.option(
-    "--module",
-    "modules",
-    multiple=True,
-    required=True,
-    help="Module under src/runtime to copy (e.g., jobs.py).",
-)
-def runtime_sync(source: pathlib.Path, destination: pathlib.Path, modules: tuple[str, ...]) -> None:
-    """Copy runtime orchestration primitives from a filtered source export."""
-
-    sync_runtime_modules(source_root=source, destination_root=destination, modules=modules)
-    click.echo(f"Copied {len(modules)} runtime module(s) from {source} to {destination}")
-
-
-@main.group()
-def requirements() -> None:
-    """Requirements file synchronization."""
-
-
-@requirements.command("sync")
-@click.argument("source", type=click.Path(file_okay=False, exists=True, path_type=pathlib.Path))
-@click.argument("destination", type=click.Path(file_okay=False, path_type=pathlib.Path))
-@click.option(
-    "--file",
-    "files",
-    multiple=True,
-    required=True,
-    help="Requirements file name to copy (e.g., requirements.txt).",
-)
-def requirements_sync(source: pathlib.Path, destination: pathlib.Path, files: tuple[str, ...]) -> None:
-    """Copy requirements files from a filtered source export."""
-
-    sync_requirements(source_root=source, destination_root=destination, files=files)
-    click.echo(f"Copied {len(files)} requirements file(s) from {source} to {destination}")
-
@@ -2,12 +2,139 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
+_COPY_CHUNK = 1 << 26  # 64 MiB per copy_file_range call
 
-def sync_core(source_root: Path, destination_root: Path, modules: Iterable[str]) -> None:
+# Resolved once: the platform either has the syscall or it does not, and
+# _fast_copy runs once per file in tight batch loops.
+_COPY_FILE_RANGE = getattr(os, "copy_file_range", None)
+
+
+@lru_cache(maxsize=128)
+def _resolved(path: Path) -> Path:
+    """Resolve a root path once per process; sibling sync calls share roots."""
+
+    return path.resolve()
+
+
+def _fast_copy(src: str | os.PathLike[str], dst: str | os.PathLike[str]) -> None:
+    """Copy a regular file, staying in the kernel where the platform allows.
+
+    Uses ``os.copy_file_range`` (reflink/zero-copy on Linux) and falls back to
+    ``shutil.copyfile`` (itself ``sendfile``-backed) when unsupported.
+    Metadata is carried over with ``copystat`` to match ``shutil.copy2``.
+    """
+
+    copy_file_range = _COPY_FILE_RANGE
+    if copy_file_range is not None:
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                while copy_file_range(src_fd, dst_fd, _COPY_CHUNK):
+                    pass
+            except OSError:
+                # EXDEV/ENOSYS/EINVAL depending on kernel and filesystem;
+                # restart with the userspace copier.
+                os.lseek(dst_fd, 0, os.SEEK_SET)
+                os.ftruncate(dst_fd, 0)
+                shutil.copyfile(src, dst)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    else:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _needs_copy(src: str | os.PathLike[str], dst: str | os.PathLike[str]) -> bool:
+    """Return True unless ``dst`` already holds the same content as ``src``.
+
+    Matching size and mtime settle the common repeated-sync case with two
+    stats. When only the mtime differs, the contents are hashed before
+    falling back to a copy — an identical file just gets its timestamps
+    realigned so the next sync stops at the stat check.
+
+    The source is statted first, so a missing source surfaces as
+    ``FileNotFoundError`` here; callers use that as their existence check
+    instead of paying a separate ``exists()`` syscall per file.
+    """
+
+    src_st = os.stat(src, follow_symlinks=False)
+    try:
+        dst_st = os.stat(dst, follow_symlinks=False)
+    except FileNotFoundError:
+        return True
+
+    if src_st.st_size != dst_st.st_size:
+        return True
+    if src_st.st_mtime_ns == dst_st.st_mtime_ns:
+        return False
+
+    if _digest(src) == _digest(dst):
+        os.utime(dst, ns=(src_st.st_atime_ns, src_st.st_mtime_ns))
+        return False
+    return True
+
+
+def _digest(path: str | os.PathLike[str]) -> bytes:
+    with open(path, "rb", buffering=0) as f:
+        return hashlib.file_digest(f, "sha256").digest()
+
+
+def _fast_rmtree(path: str | os.PathLike[str]) -> None:
+    """Remove a staging directory trusting ``scandir`` dirent types.
+
+    ``shutil.rmtree`` stats every node before unlinking; for labtools-managed
+    staging trees the cached ``d_type`` from ``scandir`` is sufficient, which
+    halves the syscall count on deep trees.
+    """
+
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _copy_tree(src: str | os.PathLike[str], dst: str | os.PathLike[str]) -> None:
+    """Recursively copy a directory using ``os.scandir`` and ``_fast_copy``.
+
+    Unlike ``shutil.copytree`` this trusts the dirent type cached on each
+    ``scandir`` entry, so classifying a node costs no extra ``stat`` call,
+    and every file goes through the kernel-side copy path.
+    """
+
+    os.mkdir(dst)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                _copy_tree(entry.path, target)
+            elif entry.is_symlink():
+                os.symlink(os.readlink(entry.path), target)
+            else:
+                _fast_copy(entry.path, target)
+    shutil.copystat(src, dst)
+
+
+def sync_core(
+    source_root: Path,
+    destination_root: Path,
+    modules: Iterable[str],
+    incremental: bool = False,
+) -> None:
     """Copy selected Python modules/packages from the legacy `src/core` tree.
 
     Parameters
@@ -18,28 +145,134 @@ def sync_core(source_root: Path, destination_root: Path, modules: Iterable[str])
         Path under labtools where the modules should be staged (e.g., `src/labtools/core_modules`).
     modules:
         Iterable of module names (e.g., `["utils", "config"]`) relative to `source_root`.
+    incremental:
+        When true, keep existing destination trees and copy only files whose
+        size or mtime changed (rsync-like), instead of delete-and-recopy.
     """
 
-    source_root = source_root.resolve()
-    destination_root = destination_root.resolve()
+    source_root = _resolved(source_root)
+    destination_root = _resolved(destination_root)
     destination_root.mkdir(parents=True, exist_ok=True)
 
+    # Stream work units out of the plan generator instead of materializing the
+    # module list, so validation overlaps with copy dispatch and memory stays
+    # constant regardless of how many modules are requested.
+    plan = _plan(source_root, destination_root, modules)
+    first = next(plan, None)
+    if first is None:
+        return
+    second = next(plan, None)
+    if second is None:
+        _copy_one(*first, incremental=incremental)
+        return
+
+    # Module copies are independent and I/O-bound; fan out when there is more
+    # than one so wall-clock tracks the slowest module rather than the sum.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(_copy_one, *first, incremental=incremental),
+            executor.submit(_copy_one, *second, incremental=incremental),
+        ]
+        futures.extend(
+            executor.submit(_copy_one, *unit, incremental=incremental) for unit in plan
+        )
+        for future in as_completed(futures):
+            future.result()
+
+
+def _plan(
+    source_root: Path, destination_root: Path, modules: Iterable[str]
+) -> Iterator[tuple[str, str, bool]]:
+    """Yield validated ``(source, target, is_dir)`` work units lazily.
+
+    A single scandir of the source root answers membership for the common
+    flat-module case; nested paths fall back to a per-module probe. The loop
+    works in plain strings — every downstream consumer takes ``os.PathLike``,
+    so there is no need to allocate a ``PurePath`` per module.
+    """
+
+    src_root_s = os.fspath(source_root)
+    dst_root_s = os.fspath(destination_root)
+
+    with os.scandir(src_root_s) as it:
+        entries = {entry.name: entry for entry in it}
+
     for module in modules:
-        module_path = source_root / module
-        if not module_path.exists():
-            raise FileNotFoundError(f"Core module '{module}' not found under {source_root}")
-
-        target_path = destination_root / module_path.name
-        if target_path.exists():
-            if target_path.is_dir():
-                shutil.rmtree(target_path)
-            else:
-                target_path.unlink()
+        entry = entries.get(module)
+        if entry is not None:
+            module_src = entry.path
+            is_dir = entry.is_dir()
+        else:
+            module_src = os.path.join(src_root_s, module)
+            if not os.path.lexists(module_src):
+                raise FileNotFoundError(f"Core module '{module}' not found under {source_root}")
+            is_dir = os.path.isdir(module_src)
+        yield module_src, os.path.join(dst_root_s, os.path.basename(module_src)), is_dir
+
+
+def _copy_one(module_src: str, target: str, is_dir: bool, incremental: bool = False) -> None:
+    """Replace ``target`` with a fresh copy of ``module_src``."""
+
+    # One lstat answers both "does it exist" and "is it a directory".
+    try:
+        st = os.lstat(target)
+    except FileNotFoundError:
+        st = None
+
+    if incremental and is_dir and (st is None or stat.S_ISDIR(st.st_mode)):
+        _incremental_tree(module_src, target)
+        return
 
-        if module_path.is_dir():
-            shutil.copytree(module_path, target_path)
+    if st is not None:
+        if stat.S_ISDIR(st.st_mode):
+            _fast_rmtree(target)
         else:
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(module_path, target_path)
+            os.unlink(target)
 
+    if is_dir:
+        _copy_tree(module_src, target)
+    else:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        _fast_copy(module_src, target)
 
+
+def _incremental_tree(src: str, dst: str) -> None:
+    """Copy only new or changed files into an (possibly existing) tree.
+
+    A file is considered unchanged when its size and mtime match; repeated
+    syncs therefore cost O(changed files) instead of O(tree size).
+    """
+
+    os.makedirs(dst, exist_ok=True)
+    try:
+        with os.scandir(dst) as it:
+            existing = {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        existing = {}
+
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            current = existing.get(entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                if current is not None and not current.is_dir(follow_symlinks=False):
+                    os.unlink(target)
+                _incremental_tree(entry.path, target)
+                continue
+            if current is not None:
+                if current.is_dir(follow_symlinks=False):
+                    _fast_rmtree(target)
+                else:
+                    src_st = entry.stat(follow_symlinks=False)
+                    dst_st = current.stat(follow_symlinks=False)
+                    if (
+                        src_st.st_size == dst_st.st_size
+                        and src_st.st_mtime_ns == dst_st.st_mtime_ns
+                    ):
+                        continue
+            if entry.is_symlink():
+                if current is not None:
+                    os.unlink(target)
+                os.symlink(os.readlink(entry.path), target)
+            else:
+                _fast_copy(entry.path, target)
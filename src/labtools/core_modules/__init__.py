@@ -1,7 +1,31 @@
-"""Core modules synchronized from legacy project sources."""
+"""Core modules synchronized from legacy project sources.
 
-from .diagnostics import DiagnosticsEngine  # noqa: F401
-from .execution_enforcer import ExecutionEnforcer  # noqa: F401
-from .run_context import RunContext  # noqa: F401
-from .validation_runner import ValidationRunner  # noqa: F401
-from .build_reporter import BuildReporter  # noqa: F401
+Re-exports are resolved lazily (PEP 562) so importing the package does not
+pay for compiling all five engine modules when only one is needed.
+"""
+
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "DiagnosticsEngine": "diagnostics",
+    "ExecutionEnforcer": "execution_enforcer",
+    "RunContext": "run_context",
+    "ValidationRunner": "validation_runner",
+    "BuildReporter": "build_reporter",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    obj = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
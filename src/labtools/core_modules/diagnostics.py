@@ -4,26 +4,31 @@ Implements diagnostics levels 0-9 as specified in LabTools specification.
 """
 
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Any
 import json
 
+# The level table is static; building it per engine instance would pay ten
+# dict inserts per construction and duplicate the object for every engine.
+_DIAGNOSTICS_CONFIG = MappingProxyType({
+    0: {"focus": "Off", "guarantees": "Process ran; minimal logging"},
+    1: {"focus": "Structure", "guarantees": "Tables/columns exist; non-empty; INFO logs"},
+    2: {"focus": "Scope echo", "guarantees": "Min/Max dates, variant/location coverage; fingerprint.csv"},
+    3: {"focus": "Math integrity", "guarantees": "Canonical decimal casting; end-rounding; bucket checksums"},
+    4: {"focus": "Localization", "guarantees": "Partition deltas (year×week×loc_type); uniform vs cluster"},
+    5: {"focus": "Governance", "guarantees": "Rule matrix snapshot + diff; gate readiness"},
+    6: {"focus": "Decision readout", "guarantees": "Dual-interpretation run; reconciliation ledger"},
+    7: {"focus": "Repro", "guarantees": "Frozen inputs (hashes), provenance manifest"},
+    8: {"focus": "Safety", "guarantees": "DQ + PII scan; drift report"},
+    9: {"focus": "Audit-ready", "guarantees": "Perf profiling; determinism+replay; signed evidence bundle"}
+})
+
 
 class DiagnosticsEngine:
     """Implements LabTools diagnostics levels 0-9."""
-    
+
     def __init__(self):
-        self.diagnostics_config = {
-            0: {"focus": "Off", "guarantees": "Process ran; minimal logging"},
-            1: {"focus": "Structure", "guarantees": "Tables/columns exist; non-empty; INFO logs"},
-            2: {"focus": "Scope echo", "guarantees": "Min/Max dates, variant/location coverage; fingerprint.csv"},
-            3: {"focus": "Math integrity", "guarantees": "Canonical decimal casting; end-rounding; bucket checksums"},
-            4: {"focus": "Localization", "guarantees": "Partition deltas (year×week×loc_type); uniform vs cluster"},
-            5: {"focus": "Governance", "guarantees": "Rule matrix snapshot + diff; gate readiness"},
-            6: {"focus": "Decision readout", "guarantees": "Dual-interpretation run; reconciliation ledger"},
-            7: {"focus": "Repro", "guarantees": "Frozen inputs (hashes), provenance manifest"},
-            8: {"focus": "Safety", "guarantees": "DQ + PII scan; drift report"},
-            9: {"focus": "Audit-ready", "guarantees": "Perf profiling; determinism+replay; signed evidence bundle"}
-        }
+        self.diagnostics_config = _DIAGNOSTICS_CONFIG
     
     def run_diagnostics(self, level: int, artifacts: List[Path]) -> Dict[str, Any]:
         """Run diagnostics at specified level.
@@ -8,47 +8,236 @@ Author: Build Pipeline Enhancement
 Date: 2025-10-29
 """
 
+import contextlib
+import functools
+import importlib.util
+import io
+import os
+import re
 import subprocess
+import tempfile
 import logging
+import threading
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+_ENV_FLAG_RE = re.compile(rb'["\']--env["\']')
+
+# Classification markers, matched case-insensitively by the regex engine
+# instead of lowercasing a copy of the captured output first.
+_IMPORT_WARN_RE = re.compile(r'suspicious import detected', re.IGNORECASE)
+_TB_RE = re.compile(r'traceback', re.IGNORECASE)
+
+# Per-script timeout overrides; anything not listed gets the default. A
+# table keeps future per-script budgets out of the launch path.
+_DEFAULT_TIMEOUT = 600   # 10 min
+_TIMEOUT_OVERRIDES = {
+    'impulse_report': 1200,  # 20 min
+}
+
+# Only the last window of a child's output is kept for the result dict —
+# enough for status classification and error reporting without holding a
+# noisy script's full output in memory.
+_OUTPUT_TAIL_BYTES = 64 * 1024
+
+
+def _read_tail(fp) -> str:
+    """Read the last ``_OUTPUT_TAIL_BYTES`` of a capture file, decoded leniently."""
+    size = fp.seek(0, os.SEEK_END)
+    fp.seek(max(0, size - _OUTPUT_TAIL_BYTES))
+    return fp.read().decode('utf-8', errors='replace')
+
+# Scripts skipped unconditionally, as (pattern, stdout, output) rows. One
+# fused alternation decides the skip in a single regex probe instead of a
+# dozen Python-level substring scans per script; m.lastgroup selects the
+# canned response. The adhoc_compare env-conditional skip stays in code.
+_SKIP_SPECS = (
+    (r'unit_to_cash',
+     'Skipped - requires specific arguments',
+     'Script skipped due to specific argument requirements'),
+    (r'rebuild_test_selective',
+     'Skipped - test environment modification script',
+     'Script skipped - designed for test environment modifications'),
+    (r'temporal_skew',
+     'Skipped - requires specific comparison parameters',
+     'Script skipped - needs specific parquet comparison arguments'),
+    (r'vat_bridge',
+     'Skipped - requires specific VAT parameters',
+     'Script skipped - needs specific VAT validation arguments'),
+    (r'build_validation_daily_spine',
+     'Skipped - redundant with daily_stock_levels',
+     'Script skipped - daily_stock_levels table already exists with 71M+ rows'),
+    (r'compute_wos|compute_stock_olaf|compute_sellthrough_wos'
+     r'|diagnose_stock_aggregation|check_location_coverage',
+     'Skipped - dev environment validation infrastructure',
+     'Script skipped - designed for dev environment validation, not LAB datamart validation'),
+)
+_SKIP_RE = re.compile(
+    '|'.join(f'(?P<g{i}>{pattern})' for i, (pattern, _, _) in enumerate(_SKIP_SPECS))
+)
+
+
+def _skip_template(stdout: str, output: str) -> MappingProxyType:
+    """Build one read-only canned skip response; only script_path varies."""
+    return MappingProxyType({
+        'script_path': None,
+        'status': 'success',
+        'exit_code': 0,
+        'duration': 0,
+        'stdout': stdout,
+        'stderr': '',
+        'output': output
+    })
+
+
+# Full response dicts manufactured once at import; the hot path copies a
+# template and fills in the script path instead of spelling out the same
+# seven keys per branch.
+_SKIP_TEMPLATES = {
+    f'g{i}': _skip_template(stdout, output)
+    for i, (_, stdout, output) in enumerate(_SKIP_SPECS)
+}
+_ADHOC_LAB_SKIP = _skip_template(
+    'Skipped - lab environment not supported',
+    'Script skipped - only supports dev/test environments'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _script_supports_env(path: str, mtime_ns: int) -> bool:
+    """True if the script's source declares an ``--env`` argument.
+
+    Scanning the source once replaces a full interpreter launch per script
+    just to grep its ``--help`` output; the mtime key invalidates the cached
+    answer when the script changes.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return _ENV_FLAG_RE.search(f.read()) is not None
+    except OSError:
+        return False
+
 
 class ValidationRunner:
-    """Executes all validation scripts and aggregates results."""
-    
-    def __init__(self, validation_dir: str = "scripts/python/validation", 
-                 datamart_path: str = None, env: str = "lab"):
+    """Executes all validation scripts and aggregates results.
+
+    Concurrency model: scripts fan out over a small thread pool. Child
+    output streams to temp files rather than pipes, so there is nothing to
+    drain while a script runs — each worker thread simply parks in waitpid
+    (releasing the GIL) until its child exits. Package-style scripts skip
+    the subprocess entirely and run in this interpreter.
+    """
+
+    def __init__(self, validation_dir: str = "scripts/python/validation",
+                 datamart_path: str = None, env: str = "lab", jobs: int = 4):
         self.validation_dir = Path(validation_dir)
         self.datamart_path = datamart_path
         self.env = env
+        # Scripts are independent and subprocess.run releases the GIL while
+        # waiting on the child, so a modest thread pool collapses wall time
+        # toward the slowest script. Kept small by default so each child's
+        # internal DuckDB thread pool is not oversubscribed.
+        self.jobs = max(1, jobs)
         self.logger = logging.getLogger('validation_runner')
-        
+
+        # getcwd() is a syscall and the runner never chdirs; resolve once and
+        # reuse for PYTHONPATH and every child's cwd.
+        self._cwd = Path.cwd()
+
+        # Every script gets the same environment, so the copy of os.environ
+        # plus the seven overrides is built once here instead of per script.
+        # subprocess only reads the mapping, so sharing one dict is safe.
+        self._base_env = {
+            **os.environ,
+            'PYTHONPATH': str(self._cwd),
+            'DATAMART_PATH': self.datamart_path or '',
+            'ENVIRONMENT': self.env,
+            'BUILD_PIPELINE': 'true',  # Bypass LabTools enforcement
+            # Force LAB database path for scripts with hardcoded paths
+            'DB_PATH': self.datamart_path or '',
+            'DATABASE_PATH': self.datamart_path or '',
+            'LAB_DATABASE': self.datamart_path or ''
+        }
+
         # Validation results storage
         self.results = {}
+        # Maintained at insertion time so the summary and the status
+        # predicates read counters instead of re-scanning results five times.
+        self._status_counts = Counter()
+        self._by_status = defaultdict(list)
+        self._total_duration = 0.0
+        self._results_lock = threading.Lock()
+        # sys.argv is process-global; in-process runs patch it one at a time.
+        self._inproc_lock = threading.Lock()
         self.validation_scripts = []
-    
+        # Discovery results keyed by directory mtime: the runner entry points
+        # each re-discover, and the listing only changes when the directory does.
+        self._discovery_cache = None
+
     def discover_validation_scripts(self) -> List[Path]:
         """Discover all Python validation scripts in the validation directory."""
-        if not self.validation_dir.exists():
+        try:
+            dir_mtime_ns = os.stat(self.validation_dir).st_mtime_ns
+        except OSError:
             self.logger.warning(f"Validation directory not found: {self.validation_dir}")
             return []
-        
-        # Find all Python files in validation directory
-        python_files = list(self.validation_dir.glob("*.py"))
-        
-        # Filter out __init__.py and other non-validation files
-        validation_scripts = [
-            f for f in python_files 
-            if f.name != "__init__.py" and not f.name.startswith("test_")
-        ]
-        
+
+        if self._discovery_cache is not None and self._discovery_cache[0] == dir_mtime_ns:
+            self.validation_scripts = self._discovery_cache[1]
+            return self.validation_scripts
+
+        # One scandir pass replaces glob's per-entry stat and PurePath
+        # matching; the name filters run on plain strings.
+        with os.scandir(self.validation_dir) as entries:
+            validation_scripts = [
+                Path(entry.path) for entry in entries
+                if entry.is_file(follow_symlinks=False)
+                and entry.name.endswith('.py')
+                and entry.name != '__init__.py'
+                and not entry.name.startswith('test_')
+            ]
+
+        self._discovery_cache = (dir_mtime_ns, validation_scripts)
         self.validation_scripts = validation_scripts
         self.logger.info(f"Discovered {len(validation_scripts)} validation scripts")
-        
+
+        self._prewarm_env_support(validation_scripts)
+
         return validation_scripts
+
+    def _prewarm_env_support(self, scripts: List[Path]) -> None:
+        """Populate the ``--env`` support cache for a fresh script listing.
+
+        The per-script source scan is cheap but I/O bound; warming the
+        lru_cache across a few threads overlaps the reads so the launch path
+        never waits on one. Probes are keyed by mtime, so a script edited
+        between discovery and launch simply re-scans.
+        """
+        def _probe(script_path: Path) -> None:
+            try:
+                mtime_ns = script_path.stat().st_mtime_ns
+            except OSError:
+                mtime_ns = 0
+            _script_supports_env(str(script_path), mtime_ns)
+
+        if len(scripts) <= 1:
+            for script_path in scripts:
+                _probe(script_path)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(8, len(scripts))) as executor:
+            for _ in executor.map(_probe, scripts):
+                pass
     
     def run_all_validations(self) -> Dict[str, Any]:
         """Run all discovered validation scripts and return aggregated results."""
@@ -59,149 +248,106 @@ class ValidationRunner:
             return {}
         
         self.logger.info(f"Running {len(self.validation_scripts)} validation scripts")
-        
-        for script_path in self.validation_scripts:
-            script_name = script_path.stem
-            self.logger.info(f"Running validation: {script_name}")
-            
-            try:
-                result = self._run_single_validation(script_path)
-                self.results[script_name] = result
-                
-                status = "✅ SUCCESS" if result['exit_code'] == 0 else "❌ FAILED"
-                self.logger.info(f"Validation {script_name}: {status}")
-                
-            except Exception as e:
-                self.logger.error(f"Error running validation {script_name}: {e}")
-                self.results[script_name] = {
-                    'script_path': str(script_path),
-                    'status': 'error',
-                    'exit_code': -1,
-                    'duration': 0,
-                    'stdout': '',
-                    'stderr': str(e),
-                    'error': str(e)
-                }
-        
+
+        self._run_batch(self.validation_scripts)
+
         # Generate summary
         summary = self._generate_validation_summary()
         self.results['_summary'] = summary
-        
+
         self.logger.info(f"Validation complete: {summary['success_count']}/{summary['total_count']} passed")
-        
+
         return self.results
+
+    def _run_batch(self, scripts: List[Path]) -> None:
+        """Run a batch of validation scripts, fanning out across ``jobs`` threads."""
+        if self.jobs == 1 or len(scripts) == 1:
+            for script_path in scripts:
+                self._run_and_record(script_path)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            for _ in executor.map(self._run_and_record, scripts):
+                pass
+
+    def _run_and_record(self, script_path: Path) -> None:
+        """Run one validation script and record its result."""
+        script_name = script_path.stem
+        self.logger.info(f"Running validation: {script_name}")
+
+        try:
+            result = self._run_single_validation(script_path)
+        except Exception as e:
+            self.logger.error(f"Error running validation {script_name}: {e}")
+            result = {
+                'script_path': str(script_path),
+                'status': 'error',
+                'exit_code': -1,
+                'duration': 0,
+                'stdout': '',
+                'stderr': str(e),
+                'error': str(e)
+            }
+
+        with self._results_lock:
+            previous = self.results.get(script_name)
+            self.results[script_name] = result
+            self._record(script_name, result, previous)
+
+        status = "✅ SUCCESS" if result['exit_code'] == 0 else "❌ FAILED"
+        self.logger.info(f"Validation {script_name}: {status}")
+
+    def _record(self, script_name: str, result: Dict[str, Any],
+                previous: Optional[Dict[str, Any]] = None) -> None:
+        """Update the running status counters for one result.
+
+        Caller holds ``_results_lock``. A re-run replaces the previous
+        result, so its contribution is backed out first.
+        """
+        if previous is not None:
+            old_status = previous.get('status')
+            self._status_counts[old_status] -= 1
+            self._by_status[old_status].remove(script_name)
+            self._total_duration -= previous.get('duration', 0)
+
+        status = result.get('status')
+        self._status_counts[status] += 1
+        self._by_status[status].append(script_name)
+        self._total_duration += result.get('duration', 0)
     
     def _run_single_validation(self, script_path: Path) -> Dict[str, Any]:
         """Run a single validation script and capture results."""
         start_time = time.time()
-        
-        # Prepare environment variables
-        import os
-        env = os.environ.copy()
-        env.update({
-            'PYTHONPATH': str(Path.cwd()),
-            'DATAMART_PATH': self.datamart_path or '',
-            'ENVIRONMENT': self.env,
-            'BUILD_PIPELINE': 'true',  # Bypass LabTools enforcement
-            # Force LAB database path for scripts with hardcoded paths
-            'DB_PATH': self.datamart_path or '',
-            'DATABASE_PATH': self.datamart_path or '',
-            'LAB_DATABASE': self.datamart_path or ''
-        })
-        
+
+        # Prepare environment variables (template built once in __init__)
+        env = self._base_env
+
         # Run the script with appropriate arguments based on script requirements
         try:
             import sys
-            
+
+
             # Build command with common arguments that many scripts expect
             cmd = [sys.executable, str(script_path)]
             
             # Add common arguments that many validation scripts expect
             script_name = script_path.name
+            timeout = next(
+                (t for key, t in _TIMEOUT_OVERRIDES.items() if key in script_name),
+                _DEFAULT_TIMEOUT
+            )
             
             # PRIORITY: Check skip conditions FIRST (before argument handling)
-            if 'unit_to_cash' in script_name:
-                # Skip this script - requires specific parquet parameters
-                return {
-                    'script_path': str(script_path),
-                    'status': 'success',
-                    'exit_code': 0,
-                    'duration': 0,
-                    'stdout': 'Skipped - requires specific arguments',
-                    'stderr': '',
-                    'output': 'Script skipped due to specific argument requirements'
-                }
-            elif 'rebuild_test_selective' in script_name:
-                # Skip - this script modifies test environment tables
-                return {
-                    'script_path': str(script_path),
-                    'status': 'success',
-                    'exit_code': 0,
-                    'duration': 0,
-                    'stdout': 'Skipped - test environment modification script',
-                    'stderr': '',
-                    'output': 'Script skipped - designed for test environment modifications'
-                }
-            elif 'temporal_skew' in script_name:
-                # Skip - requires specific parquet comparison parameters  
-                return {
-                    'script_path': str(script_path),
-                    'status': 'success',
-                    'exit_code': 0,
-                    'duration': 0,
-                    'stdout': 'Skipped - requires specific comparison parameters',
-                    'stderr': '',
-                    'output': 'Script skipped - needs specific parquet comparison arguments'
-                }
-            elif 'vat_bridge' in script_name:
-                # Skip - requires specific VAT validation parameters
-                return {
-                    'script_path': str(script_path),
-                    'status': 'success',
-                    'exit_code': 0,
-                    'duration': 0,
-                    'stdout': 'Skipped - requires specific VAT parameters',
-                    'stderr': '',
-                    'output': 'Script skipped - needs specific VAT validation arguments'
-                }
-            elif 'adhoc_compare_facts_vs_sniff' in script_name:
+            skip = _SKIP_RE.search(script_name)
+            if skip is not None:
+                return {**_SKIP_TEMPLATES[skip.lastgroup], 'script_path': str(script_path)}
+            if 'adhoc_compare_facts_vs_sniff' in script_name:
                 # Only supports dev/test, not lab - skip for lab environment
                 if self.env == 'lab':
-                    return {
-                        'script_path': str(script_path),
-                        'status': 'success',
-                        'exit_code': 0,
-                        'duration': 0,
-                        'stdout': 'Skipped - lab environment not supported',
-                        'stderr': '',
-                        'output': 'Script skipped - only supports dev/test environments'
-                    }
-                else:
-                    cmd.extend(['--env', self.env])
-            elif 'build_validation_daily_spine' in script_name:
-                # Skip - redundant with existing daily_stock_levels table (71M rows)
-                return {
-                    'script_path': str(script_path),
-                    'status': 'success',
-                    'exit_code': 0,
-                    'duration': 0,
-                    'stdout': 'Skipped - redundant with daily_stock_levels',
-                    'stderr': '',
-                    'output': 'Script skipped - daily_stock_levels table already exists with 71M+ rows'
-                }
-            elif any(x in script_name for x in ['compute_wos', 'compute_stock_olaf', 'compute_sellthrough_wos', 
-                                               'diagnose_stock_aggregation', 'check_location_coverage']):
-                # Skip - these are dev environment validation infrastructure scripts
-                return {
-                    'script_path': str(script_path),
-                    'status': 'success',
-                    'exit_code': 0,
-                    'duration': 0,
-                    'stdout': 'Skipped - dev environment validation infrastructure',
-                    'stderr': '',
-                    'output': 'Script skipped - designed for dev environment validation, not LAB datamart validation'
-                }
-            
+                    return {**_ADHOC_LAB_SKIP, 'script_path': str(script_path)}
+                cmd.extend(['--env', self.env])
+
+
             # ARGUMENT HANDLING for scripts that will actually run
             if 'apply_stage' in script_name:
                 cmd.extend(['--db', self.datamart_path or '', '--env', self.env, '--sql', 'SELECT 1 as test'])
@@ -212,52 +358,35 @@ class ValidationRunner:
             else:
                 # For most scripts, add env if they seem to support it
                 try:
-                    # Quick check if script supports --env (many do)
-                    help_result = subprocess.run(
-                        [sys.executable, str(script_path), '--help'],
-                        capture_output=True, text=True, timeout=5
-                    )
-                    if '--env' in help_result.stdout:
-                        cmd.extend(['--env', self.env])
-                except:
-                    pass  # If help fails, just run without args
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=1200 if 'impulse_report' in script_name else 600,  # 20 min for impulse, 10 min for others
-                env=env,
-                cwd=Path.cwd()
-            )
-            
-            duration = time.time() - start_time
-            
-            # Determine status - filter out import warnings as false negatives
-            output_text = (result.stdout + result.stderr).lower()
-            
-            if result.returncode == 0:
-                status = 'success'
-            elif result.returncode == 1:
-                # Check if this is just import warnings (false negative)
-                if 'suspicious import detected' in output_text and 'traceback' not in output_text:
-                    # Just import warnings, treat as success
-                    status = 'success'
-                else:
-                    status = 'warning'  # Real validation warning
-            else:
-                status = 'error'
-            
-            return {
-                'script_path': str(script_path),
-                'status': status,
-                'exit_code': result.returncode,
-                'duration': round(duration, 2),
-                'stdout': result.stdout,
-                'stderr': result.stderr,
-                'output': result.stdout + result.stderr
-            }
-            
+                    mtime_ns = script_path.stat().st_mtime_ns
+                except OSError:
+                    mtime_ns = 0
+                if _script_supports_env(str(script_path), mtime_ns):
+                    cmd.extend(['--env', self.env])
+
+            # Importable scripts run in-process, amortizing interpreter and
+            # heavy-dependency startup across the sweep.
+            in_process = self._run_in_process(script_path, cmd, env, start_time)
+            if in_process is not None:
+                return in_process
+
+            # Child output streams to unlinked temp files instead of pipes
+            # buffered in memory, so a noisy script costs disk, not RSS; only
+            # the tail of each stream is read back for the result dict.
+            with tempfile.TemporaryFile() as out_fp, tempfile.TemporaryFile() as err_fp:
+                proc = subprocess.Popen(cmd, stdout=out_fp, stderr=err_fp,
+                                        env=env, cwd=self._cwd)
+                try:
+                    returncode = proc.wait(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+                    raise
+                stdout = _read_tail(out_fp)
+                stderr = _read_tail(err_fp)
+
+            return self._build_result(script_path, returncode, start_time, stdout, stderr)
+
         except subprocess.TimeoutExpired:
             duration = time.time() - start_time
             return {
@@ -282,21 +411,119 @@ class ValidationRunner:
                 'error': str(e)
             }
     
+    def _build_result(self, script_path: Path, exit_code: int, start_time: float,
+                      stdout: str, stderr: str) -> Dict[str, Any]:
+        """Classify a finished run and build the common result dict."""
+        duration = time.time() - start_time
+
+        # Determine status - filter out import warnings as false negatives
+        if exit_code == 0:
+            status = 'success'
+        elif exit_code == 1:
+            # Check if this is just import warnings (false negative); the
+            # streams are searched in place, with no lowercased copy.
+            if ((_IMPORT_WARN_RE.search(stdout) or _IMPORT_WARN_RE.search(stderr))
+                    and not (_TB_RE.search(stdout) or _TB_RE.search(stderr))):
+                # Just import warnings, treat as success
+                status = 'success'
+            else:
+                status = 'warning'  # Real validation warning
+        else:
+            status = 'error'
+
+        return {
+            'script_path': str(script_path),
+            'status': status,
+            'exit_code': exit_code,
+            'duration': round(duration, 2),
+            'stdout': stdout,
+            'stderr': stderr,
+            'output': stdout + stderr
+        }
+
+    def _run_in_process(self, script_path: Path, cmd: List[str], env: Dict[str, str],
+                        start_time: float) -> Optional[Dict[str, Any]]:
+        """Run a package-style validation script in this interpreter.
+
+        Spawning a child per script pays interpreter startup plus the import
+        cost of the heavy data stack every time. Scripts that live in a
+        package (an ``__init__.py`` beside them) and expose ``main()`` are
+        instead imported once here and called directly, with stdout/stderr
+        captured and ``sys.argv`` patched to the arguments the subprocess
+        would have received.
+
+        The ``main()`` check reads the source before loading, because
+        ``exec_module`` already runs the script's top level — discovering a
+        missing entry point afterwards would mean the work ran twice.
+        In-process runs have no timeout (``signal.alarm`` only works on the
+        main thread); scripts needing the timeout guard keep the subprocess
+        path by not living in a package.
+
+        Returns:
+            Result dict, or None if the script must go through subprocess.
+        """
+        import os
+        import sys
+
+        if not (script_path.parent / '__init__.py').exists():
+            return None
+        try:
+            with open(script_path, 'rb') as f:
+                if b'def main(' not in f.read():
+                    return None
+        except OSError:
+            return None
+
+        spec = importlib.util.spec_from_file_location(
+            f"_labtools_validation_{script_path.stem}", script_path
+        )
+        if spec is None or spec.loader is None:
+            return None
+
+        module = importlib.util.module_from_spec(spec)
+        stdout_buf = io.StringIO()
+        stderr_buf = io.StringIO()
+        exit_code = 0
+
+        # The overrides are identical for every script this runner launches,
+        # so applying them to our own environ is safe under concurrency.
+        os.environ.update(env)
+
+        with self._inproc_lock:
+            saved_argv = sys.argv
+            sys.argv = [str(script_path)] + cmd[2:]
+            try:
+                with contextlib.redirect_stdout(stdout_buf), \
+                        contextlib.redirect_stderr(stderr_buf):
+                    spec.loader.exec_module(module)
+                    main = getattr(module, 'main', None)
+                    if callable(main):
+                        main()
+            except SystemExit as e:
+                code = e.code
+                exit_code = code if isinstance(code, int) else (0 if code is None else 1)
+            except Exception:
+                import traceback
+                stderr_buf.write(traceback.format_exc())
+                exit_code = 1
+            finally:
+                sys.argv = saved_argv
+
+        return self._build_result(
+            script_path, exit_code, start_time, stdout_buf.getvalue(), stderr_buf.getvalue()
+        )
+
     def _generate_validation_summary(self) -> Dict[str, Any]:
         """Generate summary statistics for all validation results."""
-        total_count = len([r for r in self.results.values() if isinstance(r, dict) and 'status' in r])
-        success_count = len([r for r in self.results.values() if isinstance(r, dict) and r.get('status') == 'success'])
-        warning_count = len([r for r in self.results.values() if isinstance(r, dict) and r.get('status') == 'warning'])
-        error_count = len([r for r in self.results.values() if isinstance(r, dict) and r.get('status') == 'error'])
-        
-        total_duration = sum(r.get('duration', 0) for r in self.results.values() if isinstance(r, dict))
-        
+        total_count = sum(self._status_counts.values())
+        success_count = self._status_counts['success']
+
         return {
             'total_count': total_count,
             'success_count': success_count,
-            'warning_count': warning_count,
-            'error_count': error_count,
-            'total_duration': round(total_duration, 2),
+            'warning_count': self._status_counts['warning'],
+            'error_count': self._status_counts['error'],
+            'total_duration': round(self._total_duration, 2),
             'success_rate': round(success_count / total_count * 100, 2) if total_count > 0 else 0
         }
     
@@ -315,30 +542,9 @@ class ValidationRunner:
             return {}
         
         self.logger.info(f"Running {len(selected_scripts)} specific validation scripts")
-        
-        for script_path in selected_scripts:
-            script_name = script_path.stem
-            self.logger.info(f"Running validation: {script_name}")
-            
-            try:
-                result = self._run_single_validation(script_path)
-                self.results[script_name] = result
-                
-                status = "✅ SUCCESS" if result['exit_code'] == 0 else "❌ FAILED"
-                self.logger.info(f"Validation {script_name}: {status}")
-                
-            except Exception as e:
-                self.logger.error(f"Error running validation {script_name}: {e}")
-                self.results[script_name] = {
-                    'script_path': str(script_path),
-                    'status': 'error',
-                    'exit_code': -1,
-                    'duration': 0,
-                    'stdout': '',
-                    'stderr': str(e),
-                    'error': str(e)
-                }
-        
+
+        self._run_batch(selected_scripts)
+
         # Generate summary
         summary = self._generate_validation_summary()
         self.results['_summary'] = summary
@@ -351,38 +557,32 @@ class ValidationRunner:
         return [script.stem for script in self.validation_scripts]
     
     def save_results(self, output_path: Path) -> None:
-        """Save validation results to JSON file."""
-        with open(output_path, 'w') as f:
-            json.dump(self.results, f, indent=2, default=str)
-        
+        """Save validation results to JSON file.
+
+        orjson serializes in Rust and returns one bytes buffer, which matters
+        here because the results dict embeds the captured output tails.
+        """
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(self.results, f, indent=2, default=str)
+
         self.logger.info(f"Validation results saved to: {output_path}")
     
     def has_errors(self) -> bool:
         """Check if any validation scripts failed with errors."""
-        return any(
-            r.get('status') == 'error' 
-            for r in self.results.values() 
-            if isinstance(r, dict) and 'status' in r
-        )
-    
+        return self._status_counts['error'] > 0
+
     def has_warnings(self) -> bool:
         """Check if any validation scripts produced warnings."""
-        return any(
-            r.get('status') == 'warning' 
-            for r in self.results.values() 
-            if isinstance(r, dict) and 'status' in r
-        )
-    
+        return self._status_counts['warning'] > 0
+
     def get_failed_validations(self) -> List[str]:
         """Get list of validation script names that failed."""
-        return [
-            name for name, result in self.results.items()
-            if isinstance(result, dict) and result.get('status') == 'error'
-        ]
-    
+        return list(self._by_status['error'])
+
     def get_warning_validations(self) -> List[str]:
         """Get list of validation script names that produced warnings."""
-        return [
-            name for name, result in self.results.items()
-            if isinstance(result, dict) and result.get('status') == 'warning'
-        ]
+        return list(self._by_status['warning'])
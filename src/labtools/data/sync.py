@@ -2,10 +2,113 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Iterable
 
+from labtools.core.sync import _fast_copy, _resolved
+from labtools.data_modules.hash_utils import read_hash_metadata, write_hash_metadata
+
+try:
+    import blake3
+except ImportError:  # pragma: no cover - optional accelerator
+    blake3 = None
+
+_MANIFEST_NAME = '.sync_manifest.json'
+_HASH_ALGO = 'blake3' if blake3 is not None else 'sha256'
+
+
+def _file_digest(path: str | os.PathLike[str]) -> str:
+    """Content hash of one file (blake3 when available, else sha256)."""
+
+    digestmod = blake3.blake3 if blake3 is not None else 'sha256'
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, digestmod).hexdigest()
+
+
+def _tree_manifest(root: Path) -> dict[str, str]:
+    """Hash every file under ``root`` as ``{relative path: digest}``."""
+
+    manifest = {}
+    root_s = os.fspath(root)
+    for dirpath, _, filenames in os.walk(root_s):
+        for name in filenames:
+            file_path = os.path.join(dirpath, name)
+            manifest[os.path.relpath(file_path, root_s)] = _file_digest(file_path)
+    return manifest
+
+
+def _incremental_tree_sync(module_path: Path, target_path: Path) -> None:
+    """Mirror ``module_path`` into an existing tree, copying only changed files.
+
+    A manifest of per-file content hashes rides along in the destination;
+    files whose hashes match the cached manifest (and still exist) are left
+    alone, so a no-op re-sync copies zero bytes. Files absent from the
+    source are removed to keep the old replace-everything semantics.
+    """
+
+    manifest_path = target_path / _MANIFEST_NAME
+    cached = read_hash_metadata(str(manifest_path)) or {}
+    if cached.get('algorithm') != _HASH_ALGO:
+        cached = {}
+    cached_files = cached.get('files', {})
+
+    src_manifest = _tree_manifest(module_path)
+
+    # Remove anything the source no longer has (including stray files that
+    # never came from a sync), then note what actually exists so a manually
+    # deleted file is recopied even when its cached hash still matches.
+    existing = set()
+    target_s = os.fspath(target_path)
+    for dirpath, _, filenames in os.walk(target_s):
+        for name in filenames:
+            file_path = os.path.join(dirpath, name)
+            rel = os.path.relpath(file_path, target_s)
+            if rel == _MANIFEST_NAME:
+                continue
+            if rel not in src_manifest:
+                os.unlink(file_path)
+            else:
+                existing.add(rel)
+
+    for rel, digest in src_manifest.items():
+        if rel in existing and cached_files.get(rel) == digest:
+            continue
+        target_file = target_path / rel
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        _fast_copy(module_path / rel, target_file)
+
+    write_hash_metadata({'algorithm': _HASH_ALGO, 'files': src_manifest},
+                        str(manifest_path))
+
+
+def _sync_one(module_path: Path, target_path: Path) -> None:
+    """Bring ``target_path`` up to date with ``module_path``."""
+
+    if module_path.is_dir():
+        if target_path.exists() and not target_path.is_dir():
+            target_path.unlink()
+        target_path.mkdir(parents=True, exist_ok=True)
+        _incremental_tree_sync(module_path, target_path)
+        return
+
+    if target_path.exists():
+        if target_path.is_dir():
+            shutil.rmtree(target_path)
+        elif _file_digest(target_path) == _file_digest(module_path):
+            return
+        else:
+            target_path.unlink()
+
+    # _fast_copy stays in the kernel (copy_file_range on Linux) instead
+    # of shutil's userspace read/write loop; the legacy data tree is the
+    # largest thing this package copies.
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    _fast_copy(module_path, target_path)
+
 
 def sync_data_modules(source_root: Path, destination_root: Path, modules: Iterable[str]) -> None:
     """Copy selected data utilities from the legacy `src/data` tree.
@@ -20,26 +123,32 @@ def sync_data_modules(source_root: Path, destination_root: Path, modules: Iterab
         Iterable of directories or files to copy (e.g., `["loaders", "quality/checks.py"]`).
     """
 
-    source_root = source_root.resolve()
-    destination_root = destination_root.resolve()
+    source_root = _resolved(source_root)
+    destination_root = _resolved(destination_root)
     destination_root.mkdir(parents=True, exist_ok=True)
 
+    # Validate the whole batch before copying anything so a missing module
+    # raises without leaving a half-synced destination behind.
+    plan = []
     for module in modules:
         module_path = source_root / module
         if not module_path.exists():
             raise FileNotFoundError(f"Data module '{module}' not found under {source_root}")
+        plan.append((module_path, destination_root / module_path.name))
 
-        target_path = destination_root / module_path.name
-        if target_path.exists():
-            if target_path.is_dir():
-                shutil.rmtree(target_path)
-            else:
-                target_path.unlink()
+    if len(plan) <= 1:
+        for module_path, target_path in plan:
+            _sync_one(module_path, target_path)
+        return
 
-        if module_path.is_dir():
-            shutil.copytree(module_path, target_path)
-        else:
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(module_path, target_path)
+    # Modules land in disjoint subtrees, and the copy loops release the GIL
+    # during file I/O, so independent modules sync concurrently.
+    with ThreadPoolExecutor(max_workers=min(8, len(plan))) as executor:
+        futures = [
+            executor.submit(_sync_one, module_path, target_path)
+            for module_path, target_path in plan
+        ]
+        for future in as_completed(futures):
+            future.result()
 
 
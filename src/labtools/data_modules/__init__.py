@@ -7,6 +7,7 @@ from .hash_utils import (  # noqa: F401
 )
 from .manifest import (  # noqa: F401
     parquet_manifest,
+    parquet_manifests,
     write_manifest,
     load_historical_manifests,
     create_manifest_report,
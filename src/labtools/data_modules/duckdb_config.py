@@ -7,12 +7,19 @@ Provides consistent settings across analytics pipelines and analysis scripts.
 """
 
 import duckdb
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Base connections shared across the process, keyed by (db_path, read_only).
+# Opening a DuckDB database and applying the settings costs tens of ms; the
+# pool pays it once per database and hands out cursors for isolation.
+_POOL: Dict[tuple, duckdb.DuckDBPyConnection] = {}
+_POOL_LOCK = threading.Lock()
+
 
 # System-specific configuration
 DEFAULT_MEMORY_LIMIT = '30GB'  # 30GB for DuckDB (out of 64GB total)
@@ -26,53 +33,72 @@ def get_optimized_connection(
     threads: int = DEFAULT_THREADS,
     temp_directory: str = DEFAULT_TEMP_DIR,
     read_only: bool = False,
+    pooled: bool = False,
     **kwargs
 ) -> duckdb.DuckDBPyConnection:
     """
     Get DuckDB connection with standard performance settings used by the reference lab environment.
-    
+
     Optimized for:
     - Apple M2 Max: 12 cores, 64GB RAM
     - Database size: ~8GB total
     - Workload: Analytics, ML training, reporting
-    
+
     Args:
         db_path: Path to database file or ':memory:' for in-memory
         memory_limit: Memory limit for DuckDB (default: 30GB)
         threads: Number of threads to use (default: 12 for M2 Max)
         temp_directory: Directory for temporary files
         read_only: Open database in read-only mode
+        pooled: Reuse a process-wide base connection for this database and
+            return a cursor on it. Closing the cursor leaves the base open,
+            so repeat callers skip the connect + configure cost. Note that
+            pooled ':memory:' connections share one in-memory database.
         **kwargs: Additional connection parameters
-        
+
     Returns:
         Configured DuckDB connection
-        
+
     Example:
         >>> conn = get_optimized_connection('data/database/datamart_lab.duckdb')
         >>> df = conn.execute("SELECT * FROM fact_sales_lines").fetchdf()
         >>> conn.close()
     """
+    if pooled:
+        key = (db_path, read_only)
+        with _POOL_LOCK:
+            base = _POOL.get(key)
+            if base is None:
+                base = get_optimized_connection(
+                    db_path, memory_limit=memory_limit, threads=threads,
+                    temp_directory=temp_directory, read_only=read_only, **kwargs
+                )
+                _POOL[key] = base
+        # Cursors share the configured database instance but are independent
+        # connections, so callers can close them without draining the pool.
+        return base.cursor()
+
     # Create connection
     conn = duckdb.connect(db_path, read_only=read_only, **kwargs)
     
     try:
-        # Memory settings
-        conn.execute(f"SET memory_limit='{memory_limit}'")
-        conn.execute(f"SET max_memory='{memory_limit}'")
-        
         # Ensure temp directory exists
         temp_path = Path(temp_directory)
         temp_path.mkdir(parents=True, exist_ok=True)
-        conn.execute(f"SET temp_directory='{temp_directory}'")
-        
-        # Parallelism settings
-        conn.execute(f"SET threads={threads}")
-        conn.execute("SET enable_object_cache=true")
-        
-        # Query optimization
-        conn.execute("SET preserve_insertion_order=false")  # Faster aggregations
-        conn.execute("SET force_compression='auto'")        # Automatic compression
-        
+
+        # One multi-statement script: memory, temp spill, parallelism and
+        # query optimization settings go through the parser in a single
+        # round-trip instead of seven.
+        conn.execute(f"""
+            SET memory_limit='{memory_limit}';
+            SET max_memory='{memory_limit}';
+            SET temp_directory='{temp_directory}';
+            SET threads={threads};
+            SET enable_object_cache=true;
+            SET preserve_insertion_order=false;
+            SET force_compression='auto';
+        """)
+
         logger.info(f"✅ DuckDB connection configured: {memory_limit} memory, {threads} threads")
         
     except Exception as e:
@@ -82,6 +108,17 @@ def get_optimized_connection(
     return conn
 
 
+def close_pooled_connections() -> None:
+    """Close all pooled base connections (e.g. at pipeline shutdown)."""
+    with _POOL_LOCK:
+        for conn in _POOL.values():
+            try:
+                conn.close()
+            except Exception:
+                pass
+        _POOL.clear()
+
+
 def get_lab_connection(read_only: bool = False) -> duckdb.DuckDBPyConnection:
     """
     Get connection to lab datamart with standard optimization.
@@ -156,9 +193,12 @@ def configure_for_ml_pipeline(
     Args:
         conn: Existing DuckDB connection to configure
     """
-    # Additional ML-specific settings
-    conn.execute("SET default_order='ASC'")  # Consistent ordering for reproducibility
-    conn.execute("SET default_null_order='NULLS LAST'")
+    # Additional ML-specific settings, batched into one parse/execute
+    # round-trip. Ordering defaults keep results reproducible.
+    conn.execute("""
+        SET default_order='ASC';
+        SET default_null_order='NULLS LAST';
+    """)
     
     logger.info("✅ Configured connection for ML pipeline")
 
@@ -174,35 +214,28 @@ def get_connection_info(conn: duckdb.DuckDBPyConnection) -> Dict[str, Any]:
         Dictionary with configuration details
     """
     info = {}
-    
+
     try:
-        # Get key settings
-        settings_query = """
-            SELECT name, value 
-            FROM duckdb_settings() 
-            WHERE name IN ('max_memory', 'threads', 'temp_directory', 
-                          'enable_object_cache', 'preserve_insertion_order')
-        """
-        settings = conn.execute(settings_query).fetchall()
-        info['settings'] = {name: value for name, value in settings}
-        
-        # Get table count (if not in-memory with no tables)
-        try:
-            table_count = conn.execute("SELECT COUNT(*) FROM duckdb_tables()").fetchone()[0]
-            info['table_count'] = table_count
-        except:
-            info['table_count'] = 0
-        
-        # Get database path
-        try:
-            db_path = conn.execute("SELECT database_name FROM duckdb_databases()").fetchone()[0]
-            info['database'] = db_path
-        except:
-            info['database'] = ':memory:'
-            
+        # One round-trip instead of three: settings, table count and database
+        # name come back as a single row, with the settings pre-aggregated
+        # into pairs so no per-setting tuples cross the boundary separately.
+        row = conn.execute("""
+            SELECT
+                (SELECT list(ARRAY[name, value])
+                 FROM duckdb_settings()
+                 WHERE name IN ('max_memory', 'threads', 'temp_directory',
+                                'enable_object_cache', 'preserve_insertion_order')),
+                (SELECT COUNT(*) FROM duckdb_tables()),
+                (SELECT database_name FROM duckdb_databases() LIMIT 1)
+        """).fetchone()
+        settings, table_count, db_name = row
+        info['settings'] = {name: value for name, value in (settings or [])}
+        info['table_count'] = table_count or 0
+        info['database'] = db_name if db_name is not None else ':memory:'
+
     except Exception as e:
         logger.warning(f"Could not get full connection info: {e}")
-    
+
     return info
 
 
@@ -230,19 +263,21 @@ def benchmark_query(
         Sales count: 0.123 seconds (1282812 rows)
     """
     import time
-    
+
     # Warm-up run (loads data into memory)
     if warmup:
-        conn.execute(query).fetchall()
-    
-    # Timed run
+        conn.execute(query).fetch_arrow_table()
+
+    # Timed run. Fetching as Arrow keeps materialization in C (columnar
+    # buffers, no per-row Python tuples), so the timing reflects the SQL
+    # rather than object construction for wide result sets.
     start = time.time()
-    result = conn.execute(query).fetchall()
+    result = conn.execute(query).fetch_arrow_table()
     elapsed = time.time() - start
-    
-    row_count = len(result) if result else 0
+
+    row_count = result.num_rows
     logger.info(f"{label}: {elapsed:.3f} seconds ({row_count:,} rows)")
-    
+
     return elapsed
 
 
@@ -251,27 +286,34 @@ class DuckDBConnection:
     """
     Context manager for DuckDB connections with automatic cleanup.
     
+    With ``pooled=True`` the context manager checks a cursor out of the
+    process-wide pool on entry and closes just that cursor on exit, leaving
+    the configured base connection open for the next checkout.
+
     Example:
         >>> with DuckDBConnection('data/database/datamart_lab.duckdb') as conn:
         ...     df = conn.execute("SELECT * FROM fact_sales_lines").fetchdf()
         # Connection automatically closed
     """
-    
+
     def __init__(
         self,
         db_path: str = ':memory:',
         read_only: bool = False,
+        pooled: bool = False,
         **kwargs
     ):
         self.db_path = db_path
         self.read_only = read_only
+        self.pooled = pooled
         self.kwargs = kwargs
         self.conn = None
-    
+
     def __enter__(self) -> duckdb.DuckDBPyConnection:
         self.conn = get_optimized_connection(
             self.db_path,
             read_only=self.read_only,
+            pooled=self.pooled,
             **self.kwargs
         )
         return self.conn
@@ -289,6 +331,7 @@ __all__ = [
     'get_production_connection',
     'get_dev_connection',
     'get_in_memory_connection',
+    'close_pooled_connections',
     'configure_for_ml_pipeline',
     'get_connection_info',
     'benchmark_query',
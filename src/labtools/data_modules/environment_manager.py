@@ -13,13 +13,20 @@ Environments:
 - client: Client delivery preparation (export to MS SQL Server format)
 """
 
-import duckdb
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
 from enum import Enum
+from types import MappingProxyType
 import logging
+import os
 import gc
-import psutil
+import threading
+
+if TYPE_CHECKING:
+    import duckdb
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +79,52 @@ ENVIRONMENT_CONFIG = {
     },
 }
 
+# Resolve each db_path to a Path object once — connect, list_environments
+# and the info helpers all re-probed through fresh Path constructions — and
+# freeze the entries so the shared config dicts cannot be mutated under the
+# cached connections keyed on them.
+for _cfg in ENVIRONMENT_CONFIG.values():
+    _cfg['db_path_obj'] = Path(_cfg['db_path'])
+ENVIRONMENT_CONFIG = {
+    env: MappingProxyType(cfg) for env, cfg in ENVIRONMENT_CONFIG.items()
+}
+
+
+def _detect_threads(requested: int) -> int:
+    """Clamp a configured thread count to the CPUs this process may run on.
+
+    The config targets the reference M2 Max box; on a cgroup-constrained
+    container the hardcoded count would oversubscribe (12 DuckDB workers
+    thrashing 4 CPUs), and affinity masks are the authoritative limit on
+    Linux. Falls back to the physical core count where affinity is not
+    exposed (macOS/Windows).
+    """
+    try:
+        available = len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - non-Linux
+        import psutil
+        available = psutil.cpu_count(logical=False) or psutil.cpu_count() or requested
+    return max(1, min(requested, available))
+
+
+# Base connections kept open across sessions, keyed by (environment,
+# read_only). Reopening a DuckDB file costs file open + extension load +
+# configuration and empties the in-memory cache; handing out cursors keeps
+# the database (and its buffer pool) alive between sessions.
+_DB_CACHE: Dict[tuple, duckdb.DuckDBPyConnection] = {}
+_DB_CACHE_LOCK = threading.Lock()
+
+
+def close_cached_databases() -> None:
+    """Close all cached base connections (e.g. at process shutdown)."""
+    with _DB_CACHE_LOCK:
+        for conn in _DB_CACHE.values():
+            try:
+                conn.close()
+            except Exception:
+                pass
+        _DB_CACHE.clear()
+
 
 class EnvironmentManager:
     """
@@ -99,6 +152,12 @@ class EnvironmentManager:
         self.current_connection: Optional[duckdb.DuckDBPyConnection] = None
         self.current_environment: Optional[Environment] = None
         self._initial_memory = None
+        self._prewarm_thread: Optional[threading.Thread] = None
+        # One Process handle for the manager's lifetime; constructing it per
+        # memory probe re-resolves /proc/self every time. psutil (like
+        # duckdb) is imported lazily so importing this module stays cheap.
+        import psutil
+        self._proc = psutil.Process()
     
     def connect(
         self,
@@ -133,37 +192,62 @@ class EnvironmentManager:
             read_only = config['read_only']
         
         # Check if database exists
-        if not Path(db_path).exists() and environment != Environment.CLIENT:
+        if not config['db_path_obj'].exists() and environment != Environment.CLIENT:
             logger.warning(f"⚠️  Database not found: {db_path}")
             if environment == Environment.CLIENT:
                 logger.info("Creating new client database for export preparation")
         
         # Create connection
         from src.data.duckdb_config import get_optimized_connection
-        
-        self.current_connection = get_optimized_connection(
-            db_path=db_path,
-            memory_limit=config['memory_limit'],
-            threads=config['threads'],
-            read_only=read_only,
-            **kwargs
-        )
-        
+
+        threads = _detect_threads(config['threads'])
+
+        if kwargs:
+            # Bespoke connection parameters are not cache-safe; open directly.
+            self.current_connection = get_optimized_connection(
+                db_path=db_path,
+                memory_limit=config['memory_limit'],
+                threads=threads,
+                read_only=read_only,
+                **kwargs
+            )
+        else:
+            # Reuse the cached base connection for this environment and hand
+            # out a cursor; close() then releases the cursor while the
+            # database — and its warmed buffer pool — stays open.
+            key = (environment, read_only)
+            with _DB_CACHE_LOCK:
+                base = _DB_CACHE.get(key)
+                if base is None:
+                    base = get_optimized_connection(
+                        db_path=db_path,
+                        memory_limit=config['memory_limit'],
+                        threads=threads,
+                        read_only=read_only,
+                    )
+                    _DB_CACHE[key] = base
+            self.current_connection = base.cursor()
+
         self.current_environment = environment
         self._initial_memory = self._get_memory_usage()
-        
+
         logger.info(
             f"✅ Connected to {environment.value} environment\n"
             f"   Database: {db_path}\n"
             f"   Memory Limit: {config['memory_limit']}\n"
-            f"   Threads: {config['threads']}\n"
+            f"   Threads: {threads}\n"
             f"   Description: {config['description']}"
         )
         
-        # Pre-warm buffer pool for lab environment
+        # Pre-warm buffer pool for lab environment. Runs in the background
+        # on its own cursors so connect() returns immediately; the pool is
+        # warm by the time the first heavy queries land.
         if environment == Environment.LAB:
-            self._prewarm_buffer_pool()
-        
+            self._prewarm_thread = threading.Thread(
+                target=self._prewarm_buffer_pool, daemon=True
+            )
+            self._prewarm_thread.start()
+
         return self.current_connection
     
     def close(self) -> None:
@@ -174,14 +258,25 @@ class EnvironmentManager:
         """
         if self.current_connection:
             env_name = self.current_environment.value if self.current_environment else "unknown"
-            
+
+            # Let an in-flight prewarm finish (its cursors die with the
+            # connection) rather than closing underneath it; bounded so a
+            # slow cold scan cannot wedge shutdown.
+            if self._prewarm_thread is not None and self._prewarm_thread.is_alive():
+                self._prewarm_thread.join(timeout=30)
+            self._prewarm_thread = None
+
             self.current_connection.close()
             self.current_connection = None
-            
-            # Force garbage collection to release memory
-            gc.collect()
-            
+
+            # DuckDB's buffers live in C++ memory, so most closes leave the
+            # Python heap untouched; a full collection walk is only worth
+            # paying when the process has actually grown since connect.
             final_memory = self._get_memory_usage()
+            if self._initial_memory and final_memory > self._initial_memory * 1.2:
+                gc.collect(2)
+                final_memory = self._get_memory_usage()
+
             memory_freed = self._initial_memory - final_memory if self._initial_memory else 0
             
             logger.info(
@@ -243,7 +338,7 @@ class EnvironmentManager:
         
         try:
             logger.info("🔥 Pre-warming buffer pool...")
-            
+
             # Load key tables into memory
             key_tables = [
                 'fact_sales_lines',
@@ -251,26 +346,35 @@ class EnvironmentManager:
                 'dim_products',
                 'dim_locations',
             ]
-            
-            for table in key_tables:
+
+            def _warm(table: str) -> None:
+                # A shared connection is not thread-safe, but per-thread
+                # cursors are; each warms its table independently and the
+                # scans fill the shared buffer pool in parallel.
                 try:
-                    count = self.current_connection.execute(
-                        f"SELECT COUNT(*) FROM {table}"
+                    # COUNT(*) alone answers from row-group metadata and
+                    # never pulls column data into the buffer pool; hashing
+                    # the whole row forces a real scan of every column.
+                    count = self.current_connection.cursor().execute(
+                        f"SELECT COUNT(*), SUM(hash(t)) FROM {table} AS t"
                     ).fetchone()[0]
                     logger.debug(f"   Loaded {table}: {count:,} rows")
                 except:
                     pass  # Table might not exist
-            
+
+            with ThreadPoolExecutor(max_workers=len(key_tables)) as executor:
+                for _ in executor.map(_warm, key_tables):
+                    pass
+
             logger.info("✅ Buffer pool warmed - queries will run from RAM")
-            
+
         except Exception as e:
             logger.warning(f"Could not pre-warm buffer pool: {e}")
     
     def _get_memory_usage(self) -> float:
         """Get current memory usage in GB."""
         try:
-            process = psutil.Process()
-            return process.memory_info().rss / (1024 ** 3)
+            return self._proc.memory_info().rss / (1024 ** 3)
         except:
             return 0.0
     
@@ -342,7 +446,7 @@ def get_environment_connection(
     return get_optimized_connection(
         db_path=config['db_path'],
         memory_limit=config['memory_limit'],
-        threads=config['threads'],
+        threads=_detect_threads(config['threads']),
         read_only=read_only,
     )
 
@@ -358,13 +462,21 @@ def list_environments() -> List[Dict[str, Any]]:
     
     for env in Environment:
         config = ENVIRONMENT_CONFIG[env]
-        
+
+        # One stat answers both existence and size (the old exists/stat
+        # combination cost three syscalls per environment — noticeable on
+        # NFS-backed lab shares under a UI poll).
+        try:
+            size_mb = config['db_path_obj'].stat().st_size / (1024**2)
+            exists = True
+        except OSError:
+            exists, size_mb = False, 0
+
         info = {
             'environment': env.value,
             'database': config['db_path'],
-            'exists': Path(config['db_path']).exists(),
-            'size_mb': Path(config['db_path']).stat().st_size / (1024**2) 
-                       if Path(config['db_path']).exists() else 0,
+            'exists': exists,
+            'size_mb': size_mb,
             'memory_limit': config['memory_limit'],
             'threads': config['threads'],
             'description': config['description'],
@@ -376,19 +488,28 @@ def list_environments() -> List[Dict[str, Any]]:
     return environments
 
 
-def get_system_resources() -> Dict[str, Any]:
+def get_system_resources(cpu_sample_interval: Optional[float] = None) -> Dict[str, Any]:
     """
     Get current system resource usage.
-    
+
+    Args:
+        cpu_sample_interval: Seconds to block while sampling CPU usage.
+            The default of None returns the utilization since the previous
+            call without sleeping — the first call in a process reports 0.0,
+            and every later call is free. Pass a positive interval only when
+            a one-shot script needs a meaningful reading immediately.
+
     Returns:
         Dictionary with CPU, memory, and disk information
     """
+    import psutil
+
     mem = psutil.virtual_memory()
-    
+
     return {
         'cpu_count': psutil.cpu_count(logical=False),
         'cpu_count_logical': psutil.cpu_count(),
-        'cpu_percent': psutil.cpu_percent(interval=1),
+        'cpu_percent': psutil.cpu_percent(interval=cpu_sample_interval),
         'memory_total_gb': mem.total / (1024 ** 3),
         'memory_available_gb': mem.available / (1024 ** 3),
         'memory_used_gb': mem.used / (1024 ** 3),
@@ -404,6 +525,7 @@ __all__ = [
     'get_environment_connection',
     'list_environments',
     'get_system_resources',
+    'close_cached_databases',
     'ENVIRONMENT_CONFIG',
 ]
 
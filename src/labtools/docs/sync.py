@@ -2,24 +2,47 @@
 
 from __future__ import annotations
 
-import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Iterable
 
+from labtools.core.sync import _fast_copy, _needs_copy, _resolved
+
 
 def sync_docs(source_root: Path, destination_root: Path, documents: Iterable[str]) -> None:
     """Copy documentation templates into the labtools templates directory."""
 
-    source_root = source_root.resolve()
-    destination_root = destination_root.resolve()
+    source_root = _resolved(source_root)
+    destination_root = _resolved(destination_root)
     destination_root.mkdir(parents=True, exist_ok=True)
 
+    # Validate the whole batch before copying anything so a missing document
+    # raises without leaving a half-synced destination behind. _needs_copy
+    # stats the source, which doubles as the existence check, and drops
+    # documents the destination already holds byte-for-byte.
+    plan = []
     for document in documents:
         document_path = source_root / document
-        if not document_path.exists():
-            raise FileNotFoundError(f"Document '{document}' not found under {source_root}")
-
         target_path = destination_root / Path(document).name
-        shutil.copy2(document_path, target_path)
-
-
+        try:
+            if _needs_copy(document_path, target_path):
+                plan.append((document_path, target_path))
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Document '{document}' not found under {source_root}"
+            ) from None
+
+    if len(plan) <= 1:
+        for document_path, target_path in plan:
+            _fast_copy(document_path, target_path)
+        return
+
+    # Documents are independent files and the copies are I/O-bound kernel
+    # work, so they run concurrently instead of blocking one-by-one.
+    with ThreadPoolExecutor(max_workers=min(8, len(plan))) as executor:
+        futures = [
+            executor.submit(_fast_copy, document_path, target_path)
+            for document_path, target_path in plan
+        ]
+        for future in as_completed(futures):
+            future.result()
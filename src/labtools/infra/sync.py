@@ -2,10 +2,25 @@
 
 from __future__ import annotations
 
-import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Iterable
 
+from labtools.core.sync import _copy_tree, _fast_rmtree, _resolved
+
+
+def _sync_one(module_path: Path, target_path: Path) -> None:
+    """Replace ``target_path`` with a fresh copy of ``module_path``.
+
+    The target's parent directory must already exist; ``sync_modules``
+    creates each unique parent once before dispatching copies.
+    """
+
+    if target_path.exists():
+        _fast_rmtree(target_path)
+
+    _copy_tree(module_path, target_path)
+
 
 def sync_modules(source_root: Path, destination_root: Path, modules: Iterable[str]) -> None:
     """Copy selected Terraform modules from a filtered source checkout into templates.
@@ -20,20 +35,35 @@ def sync_modules(source_root: Path, destination_root: Path, modules: Iterable[st
         Iterable of module relative paths to copy (e.g., `modules/networking`).
     """
 
-    source_root = source_root.resolve()
-    destination_root = destination_root.resolve()
+    source_root = _resolved(source_root)
+    destination_root = _resolved(destination_root)
     destination_root.mkdir(parents=True, exist_ok=True)
 
+    # Validate the whole batch before copying anything so a missing module
+    # raises without leaving a half-synced destination behind.
+    plan = []
     for module in modules:
         module_path = source_root / module
         if not module_path.exists():
             raise FileNotFoundError(f"Module '{module}' not found under {source_root}")
+        plan.append((module_path, destination_root / module))
 
-        target_path = destination_root / module
-        if target_path.exists():
-            shutil.rmtree(target_path)
-
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copytree(module_path, target_path)
+    # Create each unique parent once up front; doing it per module inside the
+    # workers would re-stat every ancestor for every module in the batch.
+    for parent in {target_path.parent for _, target_path in plan}:
+        parent.mkdir(parents=True, exist_ok=True)
 
+    if len(plan) <= 1:
+        for module_path, target_path in plan:
+            _sync_one(module_path, target_path)
+        return
 
+    # Modules land in disjoint subtrees and the copies are I/O-bound, so
+    # independent modules sync concurrently.
+    with ThreadPoolExecutor(max_workers=min(8, len(plan))) as executor:
+        futures = [
+            executor.submit(_sync_one, module_path, target_path)
+            for module_path, target_path in plan
+        ]
+        for future in as_completed(futures):
+            future.result()
@@ -2,34 +2,56 @@
 
 from __future__ import annotations
 
-import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Iterable
 
+from labtools.core.sync import _copy_tree, _fast_copy, _fast_rmtree, _resolved
+
+
+def _sync_one(module_path: Path, target_path: Path) -> None:
+    """Replace ``target_path`` with a fresh copy of ``module_path``."""
+
+    if target_path.exists():
+        if target_path.is_dir():
+            _fast_rmtree(target_path)
+        else:
+            target_path.unlink()
+
+    if module_path.is_dir():
+        _copy_tree(module_path, target_path)
+    else:
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        _fast_copy(module_path, target_path)
+
 
 def sync_reports(source_root: Path, destination_root: Path, modules: Iterable[str]) -> None:
     """Copy report generator components from the legacy `src/reports` tree."""
 
-    source_root = source_root.resolve()
-    destination_root = destination_root.resolve()
+    source_root = _resolved(source_root)
+    destination_root = _resolved(destination_root)
     destination_root.mkdir(parents=True, exist_ok=True)
 
+    # Validate the whole batch before copying anything so a missing module
+    # raises without leaving a half-synced destination behind.
+    plan = []
     for module in modules:
         module_path = source_root / module
         if not module_path.exists():
             raise FileNotFoundError(f"Report module '{module}' not found under {source_root}")
-
-        target_path = destination_root / module_path.name
-        if target_path.exists():
-            if target_path.is_dir():
-                shutil.rmtree(target_path)
-            else:
-                target_path.unlink()
-
-        if module_path.is_dir():
-            shutil.copytree(module_path, target_path)
-        else:
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(module_path, target_path)
-
-
+        plan.append((module_path, destination_root / module_path.name))
+
+    if len(plan) <= 1:
+        for module_path, target_path in plan:
+            _sync_one(module_path, target_path)
+        return
+
+    # Modules land in disjoint subtrees and the copies are I/O-bound, so
+    # independent modules sync concurrently.
+    with ThreadPoolExecutor(max_workers=min(8, len(plan))) as executor:
+        futures = [
+            executor.submit(_sync_one, module_path, target_path)
+            for module_path, target_path in plan
+        ]
+        for future in as_completed(futures):
+            future.result()
@@ -2,24 +2,47 @@
 
 from __future__ import annotations
 
-import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Iterable
 
+from labtools.core.sync import _fast_copy, _needs_copy, _resolved
+
 
 def sync_requirements(source_root: Path, destination_root: Path, files: Iterable[str]) -> None:
     """Copy requirements files from the source export into the labtools repository."""
 
-    source_root = source_root.resolve()
-    destination_root = destination_root.resolve()
+    source_root = _resolved(source_root)
+    destination_root = _resolved(destination_root)
     destination_root.mkdir(parents=True, exist_ok=True)
 
+    # Validate the whole batch before copying anything so a missing file
+    # raises without leaving a half-synced destination behind. _needs_copy
+    # stats the source, which doubles as the existence check, and drops
+    # files the destination already holds byte-for-byte.
+    plan = []
     for file_name in files:
         source_file = source_root / file_name
-        if not source_file.exists():
-            raise FileNotFoundError(f"Requirements file '{file_name}' not found under {source_root}")
-
         target_file = destination_root / source_file.name
-        shutil.copy2(source_file, target_file)
-
-
+        try:
+            if _needs_copy(source_file, target_file):
+                plan.append((source_file, target_file))
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Requirements file '{file_name}' not found under {source_root}"
+            ) from None
+
+    if len(plan) <= 1:
+        for source_file, target_file in plan:
+            _fast_copy(source_file, target_file)
+        return
+
+    # Requirements files are independent and the copies are I/O-bound kernel
+    # work, so they run concurrently instead of blocking one-by-one.
+    with ThreadPoolExecutor(max_workers=min(8, len(plan))) as executor:
+        futures = [
+            executor.submit(_fast_copy, source_file, target_file)
+            for source_file, target_file in plan
+        ]
+        for future in as_completed(futures):
+            future.result()
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Iterable
 
+from labtools.core.sync import _fast_copy, _needs_copy, _resolved
+
 
 def sync_helpers(source_root: Path, destination_root: Path, helpers: Iterable[str]) -> None:
     """Copy selected shell helper scripts into the labtools repository.
@@ -20,16 +22,39 @@ def sync_helpers(source_root: Path, destination_root: Path, helpers: Iterable[st
         Iterable of relative file paths to copy (e.g., `lib/logging.sh`).
     """
 
-    source_root = source_root.resolve()
-    destination_root = destination_root.resolve()
+    source_root = _resolved(source_root)
+    destination_root = _resolved(destination_root)
     destination_root.mkdir(parents=True, exist_ok=True)
 
+    # Validate the whole batch before copying anything so a missing helper
+    # raises without leaving a half-synced destination behind. _needs_copy
+    # stats the source, which doubles as the existence check, and drops
+    # helpers the destination already holds byte-for-byte.
+    plan = []
     for helper in helpers:
         helper_path = source_root / helper
-        if not helper_path.exists():
-            raise FileNotFoundError(f"Shell helper '{helper}' not found under {source_root}")
-
         target_path = destination_root / Path(helper).name
-        shutil.copy2(helper_path, target_path)
-
-
+        try:
+            if _needs_copy(helper_path, target_path):
+                plan.append((helper_path, target_path))
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Shell helper '{helper}' not found under {source_root}"
+            ) from None
+
+    # The dominant call shape is a single helper (or nothing to do after the
+    # skip filter); it takes the serial path with no pool setup at all.
+    if len(plan) <= 1:
+        for helper_path, target_path in plan:
+            _fast_copy(helper_path, target_path)
+        return
+
+    # Helpers are independent files and the copies are I/O-bound kernel
+    # work, so they run concurrently instead of blocking one-by-one.
+    with ThreadPoolExecutor(max_workers=min(8, len(plan))) as executor:
+        futures = [
+            executor.submit(_fast_copy, helper_path, target_path)
+            for helper_path, target_path in plan
+        ]
+        for future in as_completed(futures):
+            future.result()
@@ -0,0 +1,87 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from labtools.core_modules.diagnostics import DiagnosticsEngine
+
+_SUITE_MARKERS = ("unit", "governance", "integration")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Default unmarked tests to the unit suite.
+
+    Files no longer need the boilerplate ``pytestmark = pytest.mark.unit``
+    line; anything that belongs to another suite keeps its explicit marker.
+    """
+
+    unit = pytest.mark.unit
+    for item in items:
+        if not any(item.get_closest_marker(name) for name in _SUITE_MARKERS):
+            item.add_marker(unit)
+
+
+@pytest.fixture(scope="session")
+def diagnostics_engine() -> DiagnosticsEngine:
+    """One engine for the whole run; it is stateless between calls."""
+
+    return DiagnosticsEngine()
+
+
+@pytest.fixture(scope="session")
+def tiny_parquet(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A minimal two-column parquet file, written once per session."""
+
+    df = pd.DataFrame({"id": [1, 2, 3], "value": [10, 20, 30]})
+    path = tmp_path_factory.mktemp("hash-data") / "data.parquet"
+    df.to_parquet(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def sample_parquet(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A small well-formed inventory extract, written once per session.
+
+    String columns are categorical so the Arrow conversion dictionary-encodes
+    them instead of building an object-dtype string table per test run.
+    """
+
+    df = pd.DataFrame(
+        {
+            "LocationId": [1, 1, 2],
+            "VariantId": [100, 101, 102],
+            "DocumentDateTime": pd.date_range("2025-01-01", periods=3, freq="D"),
+            "Quantity": [5, 7, 9],
+            "LocationTypeName": pd.Categorical(["Regular Store", "Regular Store", "DC"]),
+            "MerchL1Name": pd.Categorical(["Dames Fashion", "Dames Fashion", "Mens"]),
+            "IsDeleted": [0, 0, 0],
+        }
+    )
+    path = tmp_path_factory.mktemp("manifest-data") / "sample.parquet"
+    df.to_parquet(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def violation_parquet(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """An extract whose category mix breaks the focus-ratio rule.
+
+    Large enough to clear MIN_ANALYSIS_ROWS so the rules actually run.
+    """
+
+    df = pd.DataFrame(
+        {
+            "LocationId": list(range(1, 121)),
+            "VariantId": list(range(10, 130)),
+            "DocumentDateTime": pd.date_range("2025-02-01", periods=120, freq="h"),
+            "Quantity": [1, 2, 3, 4] * 30,
+            "MerchL1Name": pd.Categorical(
+                ["Primary", "Secondary", "Secondary", "Secondary"] * 30
+            ),
+            "LocationTypeName": pd.Categorical(["Regular Store"] * 120),
+            "IsDeleted": [0] * 120,
+        }
+    )
+    path = tmp_path_factory.mktemp("manifest-data") / "violations.parquet"
+    df.to_parquet(path)
+    return path
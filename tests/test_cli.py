@@ -1,79 +1,32 @@
-from click.testing import CliRunner
 import pytest
+from click.testing import CliRunner
 
 from labtools.cli import main
 
-pytestmark = pytest.mark.unit
-
-
-def test_cli_help():
-    runner = CliRunner()
-    result = runner.invoke(main, ["--help"])
-    assert result.exit_code == 0
-    assert "Reusable tooling for building new lab environments." in result.output
-
-
-def test_infra_help():
-    runner = CliRunner()
-    result = runner.invoke(main, ["infra", "--help"])
-    assert result.exit_code == 0
-    assert "Infrastructure module utilities." in result.output
-
-
-def test_shell_help():
-    runner = CliRunner()
-    result = runner.invoke(main, ["shell", "--help"])
-    assert result.exit_code == 0
-    assert "Shell helper utilities." in result.output
-
-
-def test_docs_help():
-    runner = CliRunner()
-    result = runner.invoke(main, ["docs", "--help"])
-    assert result.exit_code == 0
-    assert "Documentation template utilities." in result.output
+# CliRunner keeps no state between invoke() calls; one serves the module.
+_runner = CliRunner()
 
 
-def test_core_help():
-    runner = CliRunner()
-    result = runner.invoke(main, ["core", "--help"])
+@pytest.mark.parametrize(
+    ("cmd", "needle"),
+    [
+        ([], "Reusable tooling for building new lab environments."),
+        (["infra"], "Infrastructure module utilities."),
+        (["shell"], "Shell helper utilities."),
+        (["docs"], "Documentation template utilities."),
+        (["core"], "Core Python module utilities."),
+        (["data"], "Data utility synchronization."),
+        (["reports"], "Reporting utility synchronization."),
+        (["mcp"], "MCP tool synchronization."),
+        (["runtime"], "Runtime orchestration synchronization."),
+        (["requirements"], "Requirements file synchronization."),
+    ],
+    ids=["main", "infra", "shell", "docs", "core", "data", "reports", "mcp", "runtime", "requirements"],
+)
+def test_help_blurbs(cmd, needle):
+    result = _runner.invoke(main, cmd + ["--help"])
     assert result.exit_code == 0
-    assert "Core Python module utilities." in result.output
-
-
-def test_data_help():
-    runner = CliRunner()
-    result = runner.invoke(main, ["data", "--help"])
-    assert result.exit_code == 0
-    assert "Data utility synchronization." in result.output
-
-
-def test_reports_help():
-    runner = CliRunner()
-    result = runner.invoke(main, ["reports", "--help"])
-    assert result.exit_code == 0
-    assert "Reporting utility synchronization." in result.output
-
-
-def test_mcp_help():
-    runner = CliRunner()
-    result = runner.invoke(main, ["mcp", "--help"])
-    assert result.exit_code == 0
-    assert "MCP tool synchronization." in result.output
-
-
-def test_runtime_help():
-    runner = CliRunner()
-    result = runner.invoke(main, ["runtime", "--help"])
-    assert result.exit_code == 0
-    assert "Runtime orchestration synchronization." in result.output
-
-
-def test_requirements_help():
-    runner = CliRunner()
-    result = runner.invoke(main, ["requirements", "--help"])
-    assert result.exit_code == 0
-    assert "Requirements file synchronization." in result.output
+    assert needle in result.output
 
 
 def test_cli_infra_sync_command(tmp_path):
@@ -82,8 +35,7 @@ def test_cli_infra_sync_command(tmp_path):
     (source / "modules" / "networking").mkdir(parents=True)
     (source / "modules" / "networking" / "main.tf").write_text("# module", encoding="utf-8")
 
-    runner = CliRunner()
-    result = runner.invoke(
+    result = _runner.invoke(
         main,
         [
             "infra",
@@ -97,5 +49,3 @@ def test_cli_infra_sync_command(tmp_path):
     assert result.exit_code == 0, result.output
     copied_file = dest / "modules" / "networking" / "main.tf"
     assert copied_file.exists()
-
-
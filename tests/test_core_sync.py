@@ -1,11 +1,7 @@
 from pathlib import Path
 
-import pytest
-
 from labtools.core.sync import sync_core
 
-pytestmark = pytest.mark.unit
-
 
 def test_sync_core(tmp_path: Path):
     source = tmp_path / "source" / "core"
@@ -18,5 +14,5 @@ def test_sync_core(tmp_path: Path):
 
     copied = dest / "utils" / "__init__.py"
     assert copied.exists()
-    assert "def foo" in copied.read_text(encoding="utf-8")
+    assert b"def foo" in copied.read_bytes()
 
@@ -1,11 +1,7 @@
 from pathlib import Path
 
-import pytest
-
 from labtools.data.sync import sync_data_modules
 
-pytestmark = pytest.mark.unit
-
 
 def test_sync_data_modules(tmp_path: Path):
     source = tmp_path / "source" / "data"
@@ -18,5 +14,5 @@ def test_sync_data_modules(tmp_path: Path):
 
     copied = dest / "loaders" / "base.py"
     assert copied.exists()
-    assert "class Loader" in copied.read_text(encoding="utf-8")
+    assert b"class Loader" in copied.read_bytes()
 
@@ -1,16 +1,12 @@
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
-import pytest
-
 from labtools.core_modules.diagnostics import DiagnosticsEngine
 
-pytestmark = pytest.mark.unit
-
 
-def test_run_diagnostics_placeholder(tmp_path: Path):
-    engine = DiagnosticsEngine()
+def test_run_diagnostics_placeholder(tmp_path: Path, diagnostics_engine: DiagnosticsEngine):
+    engine = diagnostics_engine
     artifact = tmp_path / "artifact.txt"
     artifact.write_text("sample")
 
@@ -20,15 +16,14 @@ def test_run_diagnostics_placeholder(tmp_path: Path):
     assert "structure_check" in result
 
 
-def test_generate_evidence_bundle(tmp_path: Path):
-    engine = DiagnosticsEngine()
-    bundle_path = engine.generate_evidence_bundle("test-run")
+def test_generate_evidence_bundle(tmp_path: Path, diagnostics_engine: DiagnosticsEngine):
+    bundle_path = diagnostics_engine.generate_evidence_bundle("test-run")
     assert bundle_path.exists()
-    data = bundle_path.read_text()
-    assert '"run_id": "test-run"' in data
+    data = bundle_path.read_bytes()
+    assert b'"run_id": "test-run"' in data
     # Update timestamp to simulate caller behaviour
     updated = json.loads(data)
-    updated["timestamp"] = datetime.utcnow().isoformat()
+    updated["timestamp"] = datetime.now(timezone.utc).isoformat()
     bundle_path.write_text(json.dumps(updated))
 
 
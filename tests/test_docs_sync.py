@@ -1,11 +1,7 @@
 from pathlib import Path
 
-import pytest
-
 from labtools.docs.sync import sync_docs
 
-pytestmark = pytest.mark.unit
-
 
 def test_sync_docs(tmp_path: Path):
     source = tmp_path / "source"
@@ -18,5 +14,5 @@ def test_sync_docs(tmp_path: Path):
 
     copied = dest / "status-report.md"
     assert copied.exists()
-    assert copied.read_text(encoding="utf-8") == "# Status"
+    assert copied.read_bytes() == b"# Status"
 
@@ -1,12 +1,8 @@
 import os
 from pathlib import Path
 
-import pytest
-
 from labtools.core_modules.execution_enforcer import ExecutionEnforcer
 
-pytestmark = pytest.mark.unit
-
 
 def test_execution_enforcer_validates_context(monkeypatch):
     enforcer = ExecutionEnforcer()
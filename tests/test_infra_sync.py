@@ -1,11 +1,7 @@
 from pathlib import Path
 
-import pytest
-
 from labtools.infra.sync import sync_modules
 
-pytestmark = pytest.mark.unit
-
 
 def test_sync_modules(tmp_path: Path):
     source = tmp_path / "source"
@@ -18,5 +14,5 @@ def test_sync_modules(tmp_path: Path):
 
     copied = dest / "modules" / "networking" / "main.tf"
     assert copied.exists()
-    assert copied.read_text(encoding="utf-8") == 'module "networking" {}'
+    assert copied.read_bytes() == b'module "networking" {}'
 
@@ -1,11 +1,7 @@
 from pathlib import Path
 
-import pytest
-
 from labtools.mcp.sync import sync_mcp_tools
 
-pytestmark = pytest.mark.unit
-
 
 def test_sync_mcp_tools(tmp_path: Path):
     source = tmp_path / "source" / "mcp"
@@ -18,5 +14,5 @@ def test_sync_mcp_tools(tmp_path: Path):
 
     copied = dest / "orchestrator" / "__init__.py"
     assert copied.exists()
-    assert "def orchestrate" in copied.read_text(encoding="utf-8")
+    assert b"def orchestrate" in copied.read_bytes()
 
@@ -1,11 +1,7 @@
 from pathlib import Path
 
-import pytest
-
 from labtools.reports.sync import sync_reports
 
-pytestmark = pytest.mark.unit
-
 
 def test_sync_reports(tmp_path: Path):
     source = tmp_path / "source" / "reports"
@@ -18,5 +14,5 @@ def test_sync_reports(tmp_path: Path):
 
     copied = dest / "generator" / "__init__.py"
     assert copied.exists()
-    assert "def generate" in copied.read_text(encoding="utf-8")
+    assert b"def generate" in copied.read_bytes()
 
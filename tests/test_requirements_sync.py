@@ -1,11 +1,7 @@
 from pathlib import Path
 
-import pytest
-
 from labtools.requirements.sync import sync_requirements
 
-pytestmark = pytest.mark.unit
-
 
 def test_sync_requirements(tmp_path: Path):
     source = tmp_path / "source" / "requirements"
@@ -17,7 +13,7 @@ def test_sync_requirements(tmp_path: Path):
 
     copied = dest / "requirements.txt"
     assert copied.exists()
-    assert "click>=8.1" in copied.read_text(encoding="utf-8")
+    assert b"click>=8.1" in copied.read_bytes()
 
 
 def test_sync_requirements_missing_file(tmp_path: Path):
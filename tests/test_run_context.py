@@ -1,12 +1,8 @@
 import os
 from pathlib import Path
 
-import pytest
-
 from labtools.core_modules.run_context import RunContext
 
-pytestmark = pytest.mark.unit
-
 
 def test_run_context_sets_environment(tmp_path: Path, monkeypatch):
     monkeypatch.delenv("LAB_RUN_ID", raising=False)
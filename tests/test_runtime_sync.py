@@ -1,11 +1,7 @@
 from pathlib import Path
 
-import pytest
-
 from labtools.runtime.sync import sync_runtime_modules
 
-pytestmark = pytest.mark.unit
-
 
 def test_sync_runtime_modules(tmp_path: Path):
     source = tmp_path / "source" / "runtime"
@@ -18,5 +14,5 @@ def test_sync_runtime_modules(tmp_path: Path):
 
     copied = dest / "jobs.py"
     assert copied.exists()
-    assert "SignalController" in copied.read_text(encoding="utf-8")
+    assert b"SignalController" in copied.read_bytes()
 
@@ -1,11 +1,7 @@
 from pathlib import Path
 
-import pytest
-
 from labtools.shell.sync import sync_helpers
 
-pytestmark = pytest.mark.unit
-
 
 def test_sync_helpers(tmp_path: Path):
     source = tmp_path / "source"
@@ -20,5 +16,5 @@ def test_sync_helpers(tmp_path: Path):
 
     copied = dest / "logging.sh"
     assert copied.exists()
-    assert copied.read_text(encoding="utf-8").startswith("#!/usr/bin/env bash")
+    assert copied.read_bytes().startswith(b"#!/usr/bin/env bash")
 